@@ -28,6 +28,9 @@ class Config:
     # Image Processing
     THUMBNAIL_SIZE = (200, 200)
     THUMBNAIL_QUALITY = 85
+    THUMBNAIL_RESAMPLE = 'BICUBIC'  # PIL resampling filter name used when shrinking
+    THUMBNAIL_OPTIMIZE = False  # extra Huffman pass: roughly double the encode time for a few % smaller files
+    ORIGINAL_QUALITY = 90
     MAX_WORKERS = 8
     IMAGE_TIMEOUT = 10
     
@@ -55,6 +58,11 @@ class Config:
     # Cache Settings
     CACHE_ENABLED = True
     CACHE_DURATION = 300  # 5 minutes
+    CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'family-websites-manager')
+    THUMBNAIL_CACHE_DIR = os.path.join(CACHE_DIR, 'thumbnails')
+    THUMBNAIL_CACHE_MAX_BYTES = 500 * 1024 * 1024  # 500 MB
+    ETAG_CACHE_FILE = os.path.join(CACHE_DIR, 'etags.json')
+    ETAG_CACHE_MAX_ENTRIES = 2000  # least recently used URLs are dropped past this
     
     @classmethod
     def validate(cls):
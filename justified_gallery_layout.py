@@ -8,9 +8,12 @@ class JustifiedGalleryLayout(QLayout):
         self.setSpacing(spacing)
         self.itemList = []
         self.row_height = row_height
+        self._aspects = None  # width/height per item, when the owner knows them up front
+        self._layout_key = None  # inputs of the last packing, to skip repeats
 
     def addItem(self, item):
         self.itemList.append(item)
+        self._layout_key = None
 
     def count(self):
         return len(self.itemList)
@@ -22,9 +25,16 @@ class JustifiedGalleryLayout(QLayout):
 
     def takeAt(self, index):
         if 0 <= index < len(self.itemList):
+            self._layout_key = None
             return self.itemList.pop(index)
         return None
 
+    def set_aspects(self, aspects):
+        """Use these width/height ratios instead of reading each widget's pixmap"""
+        self._aspects = list(aspects)
+        self._layout_key = None
+        self.update()
+
     def setGeometry(self, rect):
         super().setGeometry(rect)
         self.doLayout(rect)
@@ -40,9 +50,22 @@ class JustifiedGalleryLayout(QLayout):
         size += QSize(margins.left() + margins.right(), margins.top() + margins.bottom())
         return size
 
+    def _aspect(self, index, item):
+        if self._aspects is not None and index < len(self._aspects):
+            return self._aspects[index]
+        widget = item.widget()
+        pixmap = widget.pixmap() if hasattr(widget, 'pixmap') else None
+        if pixmap is not None and not pixmap.isNull():
+            return pixmap.width() / pixmap.height()
+        return 1.0
+
     def doLayout(self, rect):
         if not self.itemList:
             return
+        # With precomputed aspects the packing only depends on the rect and item count
+        key = (rect.x(), rect.y(), rect.width(), len(self.itemList))
+        if self._aspects is not None and key == self._layout_key:
+            return
         spacing = self.spacing()
         x = rect.x()
         y = rect.y()
@@ -50,13 +73,8 @@ class JustifiedGalleryLayout(QLayout):
         row_width = 0
         max_width = rect.width()
         total_height = 0
-        for item in self.itemList:
-            widget = item.widget()
-            pixmap = widget.pixmap() if hasattr(widget, 'pixmap') else None
-            if pixmap is not None and not pixmap.isNull():
-                aspect = pixmap.width() / pixmap.height()
-            else:
-                aspect = 1.0
+        for index, item in enumerate(self.itemList):
+            aspect = self._aspect(index, item)
             width = int(self.row_height * aspect)
             row.append((item, width, self.row_height))
             row_width += width + spacing
@@ -82,6 +100,7 @@ class JustifiedGalleryLayout(QLayout):
                 cur_x += w + spacing
             y += self.row_height + spacing
             total_height = y
+        self._layout_key = key
         # Set the parent widget's minimum height to total_height
         if self.parentWidget() is not None:
             self.parentWidget().setMinimumHeight(total_height)
@@ -90,4 +109,4 @@ class JustifiedGalleryLayout(QLayout):
         return Qt.Orientations(Qt.Orientation(0))
 
     def invalidate(self):
-        self.update() 
\ No newline at end of file
+        self.update()
@@ -6,26 +6,54 @@ from PyQt6.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout,
                             QHBoxLayout, QPushButton, QLabel, QScrollArea, 
                             QFrame, QGridLayout, QMessageBox, QFileDialog,
                             QLineEdit, QDialog, QListWidget, QListWidgetItem, 
-                            QSplitter, QSizePolicy, QMenu, QProgressBar, QTableWidget, QTableWidgetItem, QLayout, QStyle)
-from PyQt6.QtCore import Qt, QSize, QThread, pyqtSignal, QObject, QRect, QPoint, QEvent, QTimer
-from PyQt6.QtGui import QIcon, QFont, QColor, QPalette, QPixmap, QImage
+                            QSplitter, QSizePolicy, QMenu, QProgressBar, QTableView, QLayout, QStyle,
+                            QCheckBox)
+from PyQt6.QtCore import (Qt, QSize, QThread, pyqtSignal, QObject, QRect, QPoint, QEvent, QTimer, QBuffer,
+                          QRunnable, QThreadPool, QAbstractTableModel, QModelIndex)
+from PyQt6.QtGui import QIcon, QFont, QColor, QPalette, QPixmap, QImage, QPixmapCache
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import json
-import io
 import base64
-from PIL import Image
+import html
+try:
+    import ijson  # optional: streams large tree listings
+except ImportError:
+    ijson = None
+try:
+    import orjson  # optional: faster decoding of large API listings
+except ImportError:
+    orjson = None
+try:
+    import pybase64  # optional: SIMD base64 codec for blob uploads
+except ImportError:
+    pybase64 = None
 from dotenv import load_dotenv
 from masonry_layout import MasonryLayout  # or from main import MasonryLayout if in same file
 from justified_gallery_layout import JustifiedGalleryLayout
+from utils.cache_manager import thumbnail_cache, etag_cache
+from services.image_service import ImageService
 # Removed RepositoryView import
 # from repository_view import RepositoryView
 import concurrent.futures
+import atexit
+import functools
 import traceback
+from urllib.parse import quote, urlparse, parse_qs
 from PyQt6.QtWebEngineWidgets import QWebEngineView
+from PyQt6.QtWebEngineCore import (QWebEngineProfile, QWebEngineUrlRequestJob,
+                                   QWebEngineUrlScheme, QWebEngineUrlSchemeHandler)
 from PyQt6.QtCore import QUrl
 from PyQt6.QtWebChannel import QWebChannel
 from PyQt6.QtCore import pyqtSlot
+from PyQt6 import sip
 import time
+import random
+import threading
+import hmac
+import hashlib
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 
 # Configure logging
 log_dir = "logs"
@@ -46,6 +74,227 @@ logger = logging.getLogger(__name__)
 # Load environment variables
 load_dotenv()
 
+# Optional page_build webhook; with both the secret and the public URL set
+# (e.g. an ngrok tunnel to WEBHOOK_PORT), build results are pushed, not polled
+WEBHOOK_SECRET = os.getenv('GITHUB_WEBHOOK_SECRET')
+WEBHOOK_PUBLIC_URL = os.getenv('GITHUB_WEBHOOK_URL')
+WEBHOOK_PORT = int(os.getenv('GITHUB_WEBHOOK_PORT', '8765'))
+WEBHOOK_PATH = '/gh/pagebuild'
+# Seconds to wait for a webhook delivery before falling back to polling
+WEBHOOK_FALLBACK_DELAY = 120
+
+# Upper bound on simultaneous GitHub requests; more than this trips the
+# secondary ("abuse") rate limit, which answers 403/429 with Retry-After
+GITHUB_MAX_CONCURRENCY = 10
+GITHUB_MAX_RETRIES = 3
+# (connect, read) seconds; fail fast on a dead connection, allow slow listings
+GITHUB_API_TIMEOUT = (3.05, 27)
+# Thumbnail bytes come from raw.githubusercontent.com, a CDN that is not
+# subject to the API limits, so downloads can run wider than API calls
+RAW_DOWNLOAD_CONCURRENCY = 16
+
+def _new_session(pool_maxsize=16):
+    """Create a requests session that keeps connections alive and retries transient errors"""
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=pool_maxsize,
+        max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[502, 503, 504])
+    )
+    session.mount('https://', adapter)
+    return session
+
+# Shared by the image loader threads; pool size covers RAW_DOWNLOAD_CONCURRENCY
+_SESSION = _new_session(pool_maxsize=RAW_DOWNLOAD_CONCURRENCY)
+
+# Thumbnail download threads live for the whole process so repo switches
+# don't pay thread start-up and keep their keep-alive connections warm
+_IMAGE_EXECUTOR = concurrent.futures.ThreadPoolExecutor(
+    max_workers=RAW_DOWNLOAD_CONCURRENCY, thread_name_prefix='imgload'
+)
+atexit.register(_IMAGE_EXECUTOR.shutdown, wait=False, cancel_futures=True)
+
+# Runs independent GitHub API calls side by side for the main window
+_GITHUB_EXECUTOR = concurrent.futures.ThreadPoolExecutor(max_workers=4, thread_name_prefix='github')
+atexit.register(_GITHUB_EXECUTOR.shutdown, wait=False, cancel_futures=True)
+
+def _github_request(method, url, **kwargs):
+    """Send a GitHub request, waiting out secondary rate limits before retrying"""
+    for attempt in range(GITHUB_MAX_RETRIES + 1):
+        response = _SESSION.request(method, url, **kwargs)
+        retry_after = response.headers.get('Retry-After')
+        if response.status_code not in (403, 429) or retry_after is None or attempt == GITHUB_MAX_RETRIES:
+            return response
+        delay = int(retry_after) if retry_after.isdigit() else 1
+        logger.warning(f"Secondary rate limit hit for {url}, retrying in {delay}s")
+        # Release the connection of a streamed response before retrying
+        response.close()
+        time.sleep(delay)
+    return response
+
+def _github_get(url, **kwargs):
+    return _github_request('GET', url, **kwargs)
+
+# Stylesheet and script for the web gallery page live under resources/
+RESOURCE_DIR = os.path.join(getattr(sys, '_MEIPASS', os.path.dirname(os.path.abspath(__file__))), 'resources')
+
+def _read_resource(name):
+    with open(os.path.join(RESOURCE_DIR, name), encoding='utf-8') as f:
+        return f.read()
+
+_GALLERY_CSS = _read_resource('gallery.css')
+_GALLERY_JS = _read_resource('gallery.js')
+
+# Static parts of the web gallery page, built once per process
+_GALLERY_HTML_HEAD = '''
+        <!DOCTYPE html>
+        <html><head><meta charset="utf-8">
+        <meta name="viewport" content="width=device-width, initial-scale=1.0, maximum-scale=1.0, user-scalable=no">
+        <title>Image Gallery</title>
+        <style>
+''' + _GALLERY_CSS + '''        </style>
+        </head>
+        <body>
+        <div class="gallery-header">
+            <h1 class="gallery-title">'''
+
+_GALLERY_HTML_BODY_OPEN = '''</h1>
+        </div>
+        <div class="gallery-view">
+            <div class="gallery-container">
+            <div class="masonry">
+        '''
+
+# Fields are pre-escaped; the onclick arguments are JSON string literals
+_GALLERY_IMG_TAG = '<img src="{thumb}" data-orig-url="{orig}" data-filename="{filename}" loading="lazy" decoding="async" onclick="showImage({orig_js}, {filename_js})">\n'
+
+_GALLERY_HTML_TAIL = '''
+            </div>
+        </div>
+        </div>
+        
+        <div class="image-view" onclick="if(event.target === this) hideImage()">
+            <div class="viewer-header controls-container">
+                <h2 class="viewer-title"></h2>
+                <div class="viewer-buttons">
+                    <button onclick="event.stopPropagation(); downloadImage()">Download</button>
+                    <button onclick="event.stopPropagation(); zoomIn()">Zoom In</button>
+                    <button onclick="event.stopPropagation(); zoomOut()">Zoom Out</button>
+                    <button onclick="event.stopPropagation(); hideImage()">Close</button>
+                    <button onclick="openInNewTab()">Open in New Tab</button>
+                    <button onclick="backToGallery()">Back to Gallery</button>
+                </div>
+            </div>
+            <div class="viewer-content">
+                <img id="viewerImg" class="viewer-img" src="" />
+            </div>
+        </div>
+        
+        <script>
+''' + _GALLERY_JS + '''        </script>
+        </body></html>
+        '''
+
+def _iter_gallery_html(title, images):
+    """Yield the gallery page in pieces for (thumbnail URL, original URL, file name) tuples"""
+    yield _GALLERY_HTML_HEAD
+    yield title
+    yield _GALLERY_HTML_BODY_OPEN
+    for thumb_url, orig_url, filename in images:
+        # Escape so quotes in file names can't break the attribute or the script
+        yield _GALLERY_IMG_TAG.format(
+            thumb=html.escape(thumb_url), orig=html.escape(orig_url), filename=html.escape(filename),
+            orig_js=html.escape(json.dumps(orig_url)), filename_js=html.escape(json.dumps(filename))
+        )
+    yield _GALLERY_HTML_TAIL
+
+def _build_gallery_html(title, images):
+    """Assemble the whole gallery page as one string"""
+    return ''.join(_iter_gallery_html(title, images))
+
+# Custom URL scheme the in-app gallery uses to read thumbnails from the disk cache
+GALLERY_SCHEME = b'gallery'
+
+def _register_gallery_scheme():
+    """Register the gallery: scheme; must run before the QApplication is created"""
+    scheme = QWebEngineUrlScheme(GALLERY_SCHEME)
+    scheme.setSyntax(QWebEngineUrlScheme.Syntax.Path)
+    scheme.setFlags(QWebEngineUrlScheme.Flag.SecureScheme)
+    QWebEngineUrlScheme.registerScheme(scheme)
+
+class GalleryThumbnailSchemeHandler(QWebEngineUrlSchemeHandler):
+    """Serves gallery:<sha> URLs from the thumbnail disk cache, filling it on misses"""
+    _fetched = pyqtSignal(str, object)  # blob sha, image bytes or None
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._sources = {}  # blob sha -> download URL of the gallery on show
+        self._waiting = {}  # blob sha -> jobs waiting on its download
+        self._fetched.connect(self._on_fetched)
+
+    def reset(self):
+        """Forget the previous gallery's URLs before a new one is built"""
+        self._sources = {}
+
+    def local_url(self, sha, download_url):
+        self._sources[sha] = download_url
+        return f"{GALLERY_SCHEME.decode()}:{sha}"
+
+    def requestStarted(self, job):
+        sha = job.requestUrl().path()
+        data = thumbnail_cache.get(sha)
+        if data is not None:
+            self._reply(job, data)
+            return
+        source = self._sources.get(sha)
+        if source is None:
+            job.fail(QWebEngineUrlRequestJob.Error.UrlNotFound)
+            return
+        if sha not in self._waiting:
+            # Download off the GUI thread; the reply is sent from _on_fetched
+            self._waiting[sha] = []
+            _IMAGE_EXECUTOR.submit(self._fetch, sha, source)
+        self._waiting[sha].append(job)
+        # WebEngine deletes jobs in C++ when the page resets or cancels the
+        # request; forget them then so _on_fetched never replies to a freed job
+        job.destroyed.connect(lambda _=None, sha=sha, job=job: self._forget_job(sha, job))
+
+    def _fetch(self, sha, source):
+        """Download one thumbnail into the disk cache; runs on a pool thread"""
+        data = None
+        try:
+            response = _github_get(source, timeout=10)
+            if response.status_code == 200:
+                data = response.content
+                thumbnail_cache.set(sha, data)
+            else:
+                logger.error(f"Failed to download gallery thumbnail {sha}: {response.status_code}")
+        except requests.exceptions.RequestException as e:
+            logger.error(f"Failed to download gallery thumbnail {sha}: {e}")
+        self._fetched.emit(sha, data)
+
+    def _forget_job(self, sha, job):
+        jobs = self._waiting.get(sha)
+        if jobs is None:
+            return
+        # The entry stays, even empty, until _on_fetched pops it, so a new
+        # request for the same sha waits on the download already in flight
+        jobs[:] = [waiting for waiting in jobs if waiting is not job]
+
+    def _on_fetched(self, sha, data):
+        for job in self._waiting.pop(sha, []):
+            if data is None:
+                job.fail(QWebEngineUrlRequestJob.Error.RequestFailed)
+            else:
+                self._reply(job, data)
+
+    def _reply(self, job, data):
+        mime_type = 'image/png' if data.startswith(_IMAGE_MAGIC[1]) else 'image/jpeg'
+        # Parented to the job so the buffer lives until the reply is read
+        buffer = QBuffer(job)
+        buffer.setData(data)
+        job.reply(mime_type.encode(), buffer)
+
 class CreateRepoDialog(QDialog):
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -74,75 +323,147 @@ class CreateRepoDialog(QDialog):
     def get_repo_name(self):
         return self.name_input.text().strip()
 
+# Edge length of the square gallery cards; thumbnails are decoded straight to it
+THUMBNAIL_DECODE_SIZE = 220
+# Leading bytes of the formats in Config.SUPPORTED_IMAGE_FORMATS (JPEG, PNG)
+_IMAGE_MAGIC = (b'\xff\xd8', b'\x89PNG')
+
+# Threads for CPU-bound PIL work (thumbnailing); Pillow releases the GIL while
+# it decodes, resamples and encodes, so threads overlap without forking a Qt process
+_IMAGE_CPU_EXECUTOR = concurrent.futures.ThreadPoolExecutor(
+    max_workers=os.cpu_count(), thread_name_prefix='imgcpu'
+)
+atexit.register(_IMAGE_CPU_EXECUTOR.shutdown, wait=False, cancel_futures=True)
+
+def _decode_square_thumbnail(data):
+    """Decode image bytes into a centre-cropped THUMBNAIL_DECODE_SIZE square QImage"""
+    # Called from the download threads; Pillow drops the GIL while decoding
+    pixels, w, h = ImageService.decode_square_rgba(data, THUMBNAIL_DECODE_SIZE)
+    # copy() so the QImage owns its pixels once the bytes go away
+    return QImage(pixels, w, h, w * 4, QImage.Format.Format_RGBA8888).copy()
+
+# Loaded thumbnails are delivered to the GUI thread this many at a time,
+# or after this many seconds, whichever comes first
+IMAGE_BATCH_SIZE = 16
+IMAGE_BATCH_INTERVAL = 0.1
+
+def _response_json(response):
+    """Decode a JSON response body, with orjson when it is installed"""
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
+
+def _iter_tree_blobs(response):
+    """Yield (path, sha) for each blob in a streamed git/trees response"""
+    with response:
+        if ijson is not None:
+            # Parse while the body arrives instead of building the whole tree first
+            response.raw.decode_content = True
+            entries = ijson.items(response.raw, 'tree.item')
+        else:
+            tree = _response_json(response)
+            if tree.get('truncated'):
+                logger.warning(f"Tree listing {response.url} was truncated by GitHub")
+            entries = tree.get('tree', [])
+        for entry in entries:
+            if entry.get('type') == 'blob':
+                yield entry['path'], entry['sha']
+
 class ImageLoaderWorker(QObject):
-    image_loaded = pyqtSignal(int, QImage, str)  # index, qimage, name
+    images_loaded = pyqtSignal(list)  # [(index, qimage, name), ...]
     finished = pyqtSignal()
 
-    def __init__(self, thumbnails):
+    def __init__(self, items):
         super().__init__()
-        self.thumbnails = thumbnails
+        self.items = items  # (card index, name, sha, download_url) tuples
         self._is_cancelled = False
 
     def cancel(self):
         self._is_cancelled = True
 
-    def _download_and_process(self, idx_thumb):
-        idx, thumb = idx_thumb
+    def _download_and_process(self, item):
+        idx, name, sha, download_url = item
         if self._is_cancelled:
-            return (idx, None, thumb.get('name', ''))
-        if thumb.get('type') == 'file':
-            try:
-                response = requests.get(thumb.get('download_url', ''), timeout=10)
-                if response.status_code == 200:
-                    image = QImage.fromData(response.content)
-                    if not image.isNull():
-                        w, h = image.width(), image.height()
-                        side = min(w, h)
-                        x = (w - side) // 2
-                        y = (h - side) // 2
-                        cropped = image.copy(x, y, side, side)
-                        # Only emit QImage, not QPixmap
-                        return (idx, cropped, thumb.get('name', ''))
-                    else:
-                        logger.warning(f"Image is null for {thumb.get('name', '')}")
-                        return (idx, None, thumb.get('name', ''))
-                else:
-                    logger.error(f"Failed to download image {thumb.get('name', '')}: {response.status_code}")
-                    return (idx, None, thumb.get('name', ''))
-            except Exception as e:
-                logger.exception(f"Exception in _download_and_process for {thumb.get('name', '')}: {e}")
-                return (idx, None, thumb.get('name', ''))
-        return (idx, None, thumb.get('name', ''))
+            return (idx, None, name)
+        try:
+            data = thumbnail_cache.get(sha)
+            if data is None:
+                with _github_get(download_url, stream=True, timeout=10) as response:
+                    if response.status_code != 200:
+                        logger.error(f"Failed to download image {name}: {response.status_code}")
+                        return (idx, None, name)
+                    chunks = response.iter_content(64 * 1024)
+                    first = next(chunks, b'')
+                    # Stop before downloading the rest of something that isn't an image
+                    if not first.startswith(_IMAGE_MAGIC):
+                        logger.warning(f"Skipping {name}: not a JPEG or PNG image")
+                        return (idx, None, name)
+                    data = first + b''.join(chunks)
+                thumbnail_cache.set(sha, data)
+            image = _decode_square_thumbnail(data)
+            if not image.isNull():
+                # Only emit QImage, not QPixmap
+                return (idx, image, name)
+            else:
+                logger.warning(f"Image is null for {name}")
+                return (idx, None, name)
+        except Exception as e:
+            logger.exception(f"Exception in _download_and_process for {name}: {e}")
+            return (idx, None, name)
 
     def run(self):
         try:
-            max_workers = min(8, len(self.thumbnails)) if self.thumbnails else 1
-            with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
-                futures = []
-                for idx, thumb in enumerate(self.thumbnails):
-                    if self._is_cancelled:
-                        break
-                    futures.append(executor.submit(self._download_and_process, (idx, thumb)))
-                for future in concurrent.futures.as_completed(futures):
-                    if self._is_cancelled:
-                        break
-                    try:
-                        idx, qimage, name = future.result()
-                        self.image_loaded.emit(idx, qimage, name)
-                    except Exception as e:
-                        logger.exception(f"Exception in worker future: {e}")
+            futures = [_IMAGE_EXECUTOR.submit(self._download_and_process, item) for item in self.items]
+            try:
+                # Hand results to the GUI thread in batches rather than one event per image
+                pending = set(futures)
+                batch = []
+                last_flush = time.monotonic()
+                while pending and not self._is_cancelled:
+                    done, pending = concurrent.futures.wait(
+                        pending, timeout=IMAGE_BATCH_INTERVAL, return_when=concurrent.futures.FIRST_COMPLETED
+                    )
+                    for future in done:
+                        try:
+                            batch.append(future.result())
+                        except Exception as e:
+                            logger.exception(f"Exception in worker future: {e}")
+                    now = time.monotonic()
+                    if len(batch) >= IMAGE_BATCH_SIZE or (batch and now - last_flush >= IMAGE_BATCH_INTERVAL):
+                        self.images_loaded.emit(batch)
+                        batch = []
+                        last_flush = now
+                if batch and not self._is_cancelled:
+                    self.images_loaded.emit(batch)
+            finally:
+                # Drop queued downloads on cancel instead of draining them
+                for future in futures:
+                    future.cancel()
+            thumbnail_cache.evict()
             self.finished.emit()
         except Exception as e:
             logger.exception(f"Exception in ImageLoaderWorker.run: {e}")
             self.finished.emit()
 
+# Card pixmaps are kept in QPixmapCache by blob sha, so they survive relayouts
+# and repository switches; size in KB (~500 cards at 220x220 RGBA)
+THUMBNAIL_PIXMAP_CACHE_KB = 100 * 1024
+
+def _thumbnail_pixmap_key(sha):
+    return f"thumb-{sha}"
+
 # Placeholder for the image viewer widget
 class ImageViewerWidget(QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.repo_name = None
-        self._thumbnails = []  # Store thumbnails for responsive layout
+        # Thumbnail files as parallel lists indexed by card, for responsive layout
+        self._thumb_names = []
+        self._thumb_shas = []
+        self._thumb_urls = []
         self._image_cards = []
+        self._pending = set()  # card indices not yet submitted for download
+        self._listing_cache = {}  # repo name -> (ETag, thumbnails) of the last tree listing
         self._loader_thread = None
         self._loader_worker = None
         self._thread_running = False
@@ -167,6 +488,19 @@ class ImageViewerWidget(QWidget):
         # Install event filter on scroll area viewport for resize responsiveness
         self.scroll_area.viewport().installEventFilter(self)
 
+        # Only download thumbnails near the viewport; re-check once scrolling settles
+        self._visible_timer = QTimer(self)
+        self._visible_timer.setSingleShot(True)
+        self._visible_timer.setInterval(50)
+        self._visible_timer.timeout.connect(self._load_visible_images)
+        self.scroll_area.verticalScrollBar().valueChanged.connect(self._visible_timer.start)
+
+        # Coalesce bursts of resize events (e.g. splitter drags) into one relayout
+        self._resize_timer = QTimer(self)
+        self._resize_timer.setSingleShot(True)
+        self._resize_timer.setInterval(100)
+        self._resize_timer.timeout.connect(self._on_resize_settled)
+
         # Placeholder label
         self.placeholder_label = QLabel("Select a repository and right-click to load images.")
         self.placeholder_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
@@ -182,11 +516,8 @@ class ImageViewerWidget(QWidget):
 
     def resizeEvent(self, event):
         super().resizeEvent(event)
-        if self._thumbnails:
-            self._relayout_images()
-            self.image_justified.invalidate()
-            self.image_container.updateGeometry()
-            self.image_container.update()
+        if self._thumb_shas:
+            self._resize_timer.start()
         # Force image_container to fill the scroll area
         self.image_container.resize(self.scroll_area.viewport().size())
 
@@ -218,13 +549,13 @@ class ImageViewerWidget(QWidget):
             # Hide placeholder and show scroll area
             self.placeholder_label.setVisible(False)
             self.scroll_area.setVisible(True)
-            # Clear existing images in the grid
-            for i in reversed(range(self.image_justified.count())): 
-                widget = self.image_justified.itemAt(i).widget()
-                if widget:
-                    widget.deleteLater()
+            # Cards are only thrown away for a different repository; a reload reuses them
+            if repo_name != self.repo_name:
+                self._clear_image_grid()
+            else:
+                self._remove_status_labels()
             self.repo_name = repo_name
-            self._thumbnails = []
+            self._set_thumbnails([])
             if not repo_name:
                 self.placeholder_label.setText("Select a repository and right-click to load images.")
                 self.placeholder_label.setVisible(True)
@@ -242,38 +573,63 @@ class ImageViewerWidget(QWidget):
                     'Authorization': f"token {os.getenv('GITHUB_TOKEN')}",
                     'Accept': 'application/vnd.github.v3+json'
                 }
-                response = requests.get(
-                    f'https://api.github.com/repos/lifetime-memories/{repo_name}/contents/thumbnails',
-                    headers=headers, timeout=10
+                # Revalidate instead of refetching; a 304 doesn't count against the rate limit
+                cached_listing = self._listing_cache.get(repo_name)
+                if cached_listing:
+                    headers['If-None-Match'] = cached_listing[0]
+                # One trees call covers every directory level, unlike /contents
+                response = _SESSION.get(
+                    f'https://api.github.com/repos/lifetime-memories/{repo_name}/git/trees/HEAD?recursive=1',
+                    headers=headers, timeout=10, stream=True
                 )
+                if response.status_code != 200:
+                    # Only the status and headers are used; release the connection
+                    response.close()
                 # Clear the temporary loading message
                 for i in reversed(range(self.image_justified.count())): 
                     widget = self.image_justified.itemAt(i).widget()
                     if widget and isinstance(widget, QLabel) and "Loading images for" in widget.text():
                         widget.deleteLater()
                         break
-                if response.status_code == 200:
-                    thumbnails = response.json()
+                if response.status_code in (200, 304):
+                    if response.status_code == 304:
+                        thumbnails = cached_listing[1]
+                    else:
+                        thumbnails = [
+                            {
+                                'name': path.rsplit('/', 1)[-1],
+                                'sha': sha,
+                                'download_url': f"https://raw.githubusercontent.com/lifetime-memories/{repo_name}/HEAD/{quote(path)}"
+                            }
+                            for path, sha in _iter_tree_blobs(response)
+                            if path.startswith('thumbnails/')
+                        ]
+                        etag = response.headers.get('ETag')
+                        if etag:
+                            self._listing_cache[repo_name] = (etag, thumbnails)
                     logger.info(f"Found {len(thumbnails)} images")
-                    self._thumbnails = thumbnails if thumbnails else []
                     if thumbnails:
                         self.display_images(thumbnails)
                     else:
                         logger.info("Repository is empty, no images to display.")
                         empty_label = QLabel("No images uploaded yet. Right-click and select 'Upload Images' to add some!")
                         empty_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+                        self._clear_image_grid()
                         self.image_justified.addWidget(empty_label)
-                        self._thumbnails = []
-                elif response.status_code == 404:
-                    logger.info("Thumbnails directory not found, no images to display.")
+                        self._set_thumbnails([])
+                elif response.status_code in (404, 409):
+                    # 409 is GitHub's answer for a repository with no commits
+                    logger.info("Repository has no commits yet, no images to display.")
                     empty_label = QLabel("No images uploaded yet. Right-click and select 'Upload Images' to add some!")
                     empty_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+                    self._clear_image_grid()
                     self.image_justified.addWidget(empty_label)
-                    self._thumbnails = []
+                    self._set_thumbnails([])
                 elif response.status_code == 403 and 'X-RateLimit-Remaining' in response.headers and response.headers['X-RateLimit-Remaining'] == '0':
                     logger.error("GitHub API rate limit exceeded.")
                     error_label = QLabel("GitHub API rate limit exceeded. Please try again later.")
                     error_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+                    self._clear_image_grid()
                     self.image_justified.addWidget(error_label)
                     QMessageBox.critical(self.parentWidget(), "Error", "GitHub API rate limit exceeded. Please try again later.")
                 else:
@@ -281,6 +637,7 @@ class ImageViewerWidget(QWidget):
                     logger.error(error_msg)
                     error_label = QLabel(f"Error loading images: {response.status_code}")
                     error_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+                    self._clear_image_grid()
                     self.image_justified.addWidget(error_label)
                     QMessageBox.critical(self.parentWidget(), "Error", error_msg)
             except Exception as e:
@@ -292,9 +649,10 @@ class ImageViewerWidget(QWidget):
                 logger.exception("Error while loading images")
                 error_label = QLabel(f"An error occurred: {str(e)}")
                 error_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+                self._clear_image_grid()
                 self.image_justified.addWidget(error_label)
                 QMessageBox.critical(self.parentWidget(), "Error", f"An error occurred: {str(e)}")
-                self._thumbnails = []
+                self._set_thumbnails([])
             self.image_container.update()
         except Exception as e:
             logger.exception(f"Exception in load_images: {e}\n{traceback.format_exc()}")
@@ -302,54 +660,128 @@ class ImageViewerWidget(QWidget):
 
     def display_images(self, thumbnails):
         logger.info("Displaying images in grid (responsive)")
-        self._thumbnails = thumbnails
+        self._set_thumbnails(thumbnails)
         self._relayout_images()
 
+    def _set_thumbnails(self, thumbnails):
+        """Keep only the fields the grid needs from GitHub's file listing"""
+        files = [thumb for thumb in thumbnails if thumb.get('type', 'file') == 'file']
+        self._thumb_names = [thumb['name'] for thumb in files]
+        self._thumb_shas = [thumb.get('sha') for thumb in files]
+        self._thumb_urls = [thumb.get('download_url', '') for thumb in files]
+
     def _relayout_images(self):
-        self._clear_image_grid()
-        self._image_cards = []
-        thumbnails = self._thumbnails
-        if not thumbnails:
+        if not self._thumb_shas:
+            self._clear_image_grid()
+            return
+        if self._thumb_shas == [sha for _, sha in self._image_cards]:
+            # Same images as before: cards and any in-flight downloads stay valid
+            self.image_justified.invalidate()
+            self._visible_timer.start()
             return
         self.cancel_loading()
-        for idx, thumb in enumerate(thumbnails):
-            if thumb['type'] == 'file':
-                card = QFrame()
-                layout = QVBoxLayout(card)
-                layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
-                layout.setContentsMargins(0, 0, 0, 0)
-                layout.setSpacing(0)
-                image_label = QLabel()
-                image_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-                image_label.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
-                layout.addWidget(image_label)
-                card.setSizePolicy(QSizePolicy.Policy.Preferred, QSizePolicy.Policy.Preferred)
-                self.image_justified.addWidget(card)
-                self._image_cards.append((image_label, None))
-        # Start worker thread
+        self._ensure_cards(len(self._thumb_shas))
+        self._pending = set()
+        for idx, sha in enumerate(self._thumb_shas):
+            image_label, old_sha = self._image_cards[idx]
+            pixmap = image_label.pixmap()
+            if sha == old_sha and pixmap is not None and not pixmap.isNull():
+                continue
+            self._image_cards[idx] = (image_label, sha)
+            cached = QPixmapCache.find(_thumbnail_pixmap_key(sha)) if sha else None
+            if cached is not None:
+                image_label.setPixmap(cached)
+            else:
+                image_label.clear()
+                self._pending.add(idx)
+        self.image_justified.invalidate()
+        if self._pending:
+            # Cards only have geometry once the layout has run
+            self._visible_timer.start()
+
+    def _ensure_cards(self, n):
+        """Grow or trim the grid so it holds exactly n image cards"""
+        while len(self._image_cards) > n:
+            image_label, _ = self._image_cards.pop()
+            card = image_label.parentWidget()
+            self.image_justified.removeWidget(card)
+            card.deleteLater()
+        while len(self._image_cards) < n:
+            card = QFrame()
+            layout = QVBoxLayout(card)
+            layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
+            layout.setContentsMargins(0, 0, 0, 0)
+            layout.setSpacing(0)
+            image_label = QLabel()
+            image_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+            image_label.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
+            layout.addWidget(image_label)
+            card.setSizePolicy(QSizePolicy.Policy.Preferred, QSizePolicy.Policy.Preferred)
+            self.image_justified.addWidget(card)
+            self._image_cards.append((image_label, None))
+        # Thumbnails are cropped square, so every card's aspect is known before it loads
+        self.image_justified.set_aspects([1.0] * n)
+
+    def _load_visible_images(self):
+        """Start downloading pending thumbnails whose cards are in or near the viewport"""
+        if self._thread_running or not self._pending:
+            return
+        viewport = self.scroll_area.viewport()
+        top = self.scroll_area.verticalScrollBar().value()
+        # Prefetch one screen above and below the visible area
+        margin = viewport.height()
+        visible_rect = QRect(0, top - margin, viewport.width(), viewport.height() + 2 * margin)
+        batch = []
+        for idx in sorted(self._pending):
+            image_label, sha = self._image_cards[idx]
+            if image_label.parentWidget().geometry().intersects(visible_rect):
+                batch.append((idx, self._thumb_names[idx], sha, self._thumb_urls[idx]))
+        if not batch:
+            return
+        self._pending.difference_update(idx for idx, _, _, _ in batch)
+        # Start worker thread for visible images not decoded yet
         self._loader_thread = QThread()
-        self._loader_worker = ImageLoaderWorker(thumbnails)
+        self._loader_worker = ImageLoaderWorker(batch)
         self._loader_worker.moveToThread(self._loader_thread)
         self._loader_thread.started.connect(self._loader_worker.run)
-        self._loader_worker.image_loaded.connect(self._on_image_loaded)
+        self._loader_worker.images_loaded.connect(self._on_images_loaded)
+        self._loader_worker.finished.connect(self._on_loader_finished)
         self._loader_worker.finished.connect(self._loader_thread.quit)
         self._loader_worker.finished.connect(self._loader_worker.deleteLater)
         self._loader_thread.finished.connect(self._loader_thread.deleteLater)
         self._thread_running = True
         self._loader_thread.start()
 
-    def _on_image_loaded(self, idx, qimage, name):
+    def _on_loader_finished(self):
+        # Ignore late signals from a worker that was already cancelled
+        if self.sender() is not self._loader_worker:
+            return
+        self._thread_running = False
+        # The user may have scrolled while this batch was downloading
+        self._load_visible_images()
+
+    def _on_images_loaded(self, results):
+        # Results still queued from a cancelled worker may point at reused cards
+        if self.sender() is not self._loader_worker:
+            return
+        # Repaint once for the whole batch
+        self.image_container.setUpdatesEnabled(False)
         try:
-            if 0 <= idx < len(self._image_cards):
-                image_label, _ = self._image_cards[idx]
-                if qimage and not qimage.isNull():
-                    pixmap = QPixmap.fromImage(qimage)
-                    scaled_pixmap = pixmap.scaled(220, 220, Qt.AspectRatioMode.KeepAspectRatioByExpanding, Qt.TransformationMode.SmoothTransformation)
-                    image_label.setPixmap(scaled_pixmap)
-                else:
-                    image_label.setText("Failed to load image")
+            for idx, qimage, name in results:
+                if 0 <= idx < len(self._image_cards):
+                    image_label, sha = self._image_cards[idx]
+                    if qimage and not qimage.isNull():
+                        # The worker already cropped and scaled to card size; no GUI-thread rescale
+                        pixmap = QPixmap.fromImage(qimage)
+                        if sha:
+                            QPixmapCache.insert(_thumbnail_pixmap_key(sha), pixmap)
+                        image_label.setPixmap(pixmap)
+                    else:
+                        image_label.setText("Failed to load image")
         except Exception as e:
-            logger.exception(f"Exception in _on_image_loaded: {e}")
+            logger.exception(f"Exception in _on_images_loaded: {e}")
+        finally:
+            self.image_container.setUpdatesEnabled(True)
 
     def _clear_image_grid(self):
         try:
@@ -359,18 +791,32 @@ class ImageViewerWidget(QWidget):
                 if widget:
                     widget.deleteLater()
             self._image_cards = []
+            self._pending = set()
+            self.image_justified.set_aspects([])
         except Exception as e:
             logger.exception(f"Exception in _clear_image_grid: {e}")
 
+    def _remove_status_labels(self):
+        """Remove loading/empty/error messages from the grid, keeping image cards"""
+        for i in reversed(range(self.image_justified.count())):
+            widget = self.image_justified.itemAt(i).widget()
+            if isinstance(widget, QLabel):
+                self.image_justified.takeAt(i)
+                widget.deleteLater()
+
     def eventFilter(self, obj, event):
         if obj == self.scroll_area.viewport() and event.type() == QEvent.Type.Resize:
-            if self._thumbnails:
-                self._relayout_images()
-                self.image_justified.invalidate()
-                self.image_container.updateGeometry()
-                self.image_container.update()
+            if self._thumb_shas:
+                self._resize_timer.start()
         return super().eventFilter(obj, event)
 
+    def _on_resize_settled(self):
+        if self._thumb_shas:
+            self._relayout_images()
+            self.image_justified.invalidate()
+            self.image_container.updateGeometry()
+            self.image_container.update()
+
 class FlowLayout(QLayout):
     def __init__(self, parent=None, margin=0, spacing=-1):
         super().__init__(parent)
@@ -453,23 +899,202 @@ class GalleryPopup(QDialog):
         if thumbnails:
             self.gallery_widget.display_images(thumbnails)
 
+# Thumbnail and original file listings with sizes, fetched together in one request
+_REPO_FILES_QUERY = '''
+query($name: String!) {
+  repository(owner: "lifetime-memories", name: $name) {
+    thumbs: object(expression: "HEAD:thumbnails") {
+      ... on Tree { entries { name type object { ... on Blob { byteSize } } } }
+    }
+    root: object(expression: "HEAD:") {
+      ... on Tree { entries { name type object { ... on Blob { byteSize } } } }
+    }
+  }
+}
+'''
+
+class ImageRowsModel(QAbstractTableModel):
+    """Image table rows kept as plain tuples; cells are read on demand"""
+    HEADERS = ["Name", "Size (KB)", "Orig Size (KB)", "SHA", "Date"]
+    ROW_BATCH = 100  # rows handed to the view at a time, as it scrolls
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows = []
+        self._loaded = 0  # rows the view knows about so far
+
+    def set_rows(self, rows):
+        """Replace every row in one model reset"""
+        self.beginResetModel()
+        self._rows = list(rows)
+        self._loaded = min(len(self._rows), self.ROW_BATCH)
+        self.endResetModel()
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self._loaded
+
+    def canFetchMore(self, parent=QModelIndex()):
+        return not parent.isValid() and self._loaded < len(self._rows)
+
+    def fetchMore(self, parent=QModelIndex()):
+        """Reveal the next batch; the view asks when it scrolls near the end"""
+        count = min(self.ROW_BATCH, len(self._rows) - self._loaded)
+        if parent.isValid() or count <= 0:
+            return
+        self.beginInsertRows(QModelIndex(), self._loaded, self._loaded + count - 1)
+        self._loaded += count
+        self.endInsertRows()
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and index.isValid():
+            return self._rows[index.row()][index.column()]
+        return None
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return self.HEADERS[section]
+        return None
+
+def _format_github_date(timestamp):
+    """Turn a GitHub timestamp into 'YYYY-MM-DD HH:MM' for display"""
+    # GitHub's UTC timestamps are fixed width ('2024-01-31T12:34:56Z'), so slice
+    if len(timestamp) == 20 and timestamp[10] == 'T' and timestamp[-1] == 'Z':
+        return f"{timestamp[0:10]} {timestamp[11:16]}"
+    return datetime.fromisoformat(timestamp.replace('Z', '+00:00')).strftime('%Y-%m-%d %H:%M')
+
+class _RepoFetchSignals(QObject):
+    fetched = pyqtSignal(object)  # _fetch_repo_listing result
+    progress = pyqtSignal(int, str)  # percent, progress bar text
+    error = pyqtSignal(str)
+
+class _RepoFetchJob(QRunnable):
+    """Runs a repository listing fetch on the global thread pool"""
+
+    def __init__(self, fetch):
+        super().__init__()
+        self.fetch = fetch
+        # Created on the GUI thread, so emits from the pool are queued back to it
+        self.signals = _RepoFetchSignals()
+
+    def run(self):
+        try:
+            self.signals.fetched.emit(self.fetch(self.signals.progress.emit))
+        except Exception as e:
+            logger.exception(f"Error fetching repository listing: {e}")
+            self.signals.error.emit(f"An error occurred: {str(e)}")
+
+class _GallerySaveSignals(QObject):
+    saved = pyqtSignal(str)  # file path
+    error = pyqtSignal(str)
+
+class _GallerySaveJob(QRunnable):
+    """Writes the gallery page to disk piece by piece on the global thread pool"""
+
+    def __init__(self, file_path, title, images):
+        super().__init__()
+        self.file_path = file_path
+        self.title = title
+        self.images = images
+        self.signals = _GallerySaveSignals()
+
+    def run(self):
+        try:
+            with open(self.file_path, 'w', encoding='utf-8') as f:
+                f.writelines(_iter_gallery_html(self.title, self.images))
+            self.signals.saved.emit(self.file_path)
+        except Exception as e:
+            logger.exception(f"Error saving gallery HTML: {e}")
+            self.signals.error.emit(str(e))
+
+class _CachedResponse:
+    """A 200 response whose body is already parsed, e.g. from the ETag cache on a 304"""
+
+    status_code = 200
+
+    def __init__(self, data, headers=None):
+        self.headers = headers if headers is not None else {}
+        self._data = data
+
+    def json(self):
+        return self._data
+
+# Seconds a repo's default branch and Pages state are reused between publishes
+REPO_META_TTL = 300
+
+# Minimum seconds between intermediate progress repaints; 20 Hz looks smooth
+UI_PUMP_INTERVAL = 0.05
+
 class MainWindow(QMainWindow):
+    # Lets pool threads hand responses to _check_rate_limit on the GUI thread
+    _rate_limit_response = pyqtSignal(object)
+
+    # Prebuilt status label stylesheets, so status ticks don't rebuild the QSS text
+    _BUILD_STATUS_STYLES = {color: f"padding: 5px; color: {color}; font-size: 11px;"
+                            for color in ('gray', 'blue', 'green', 'orange', 'red')}
+    _RATE_LIMIT_STYLES = {color: f"padding: 5px; color: {color};"
+                          for color in ('gray', 'green', 'orange', 'red')}
+
     def __init__(self):
         super().__init__()
         logger.info("Initializing MainWindow")
         self.setWindowTitle("Family Websites Repository Manager")
         self.setMinimumSize(1200, 800)
-        
+
+        # GitHub auth headers, read once so every request uses the same token
+        self._gh_headers = {
+            'Authorization': f"token {os.getenv('GITHUB_TOKEN')}",
+            'Accept': 'application/vnd.github.v3+json'
+        }
+        # One keep-alive session for the window's API calls, so multi-step
+        # flows like publishing reuse a single TLS connection
+        self._session = _new_session(pool_maxsize=32)
+        self._session.headers.update(self._gh_headers)
+
         # Add cache for GitHub data
         self._commit_cache = {}
         self._content_cache = {}
         self._rate_limit_remaining = None
         self._rate_limit_reset = None
+        self._last_rate_headers = None  # raw (remaining, reset) headers last parsed
+        self._rate_limit_warned_reset = None  # reset epoch of the window already warned about
+        self._rate_limit_response.connect(self._check_rate_limit)
+        self._last_pump = 0.0  # monotonic time of the last _pump_ui flush
+        self._repo_meta_cache = {}  # repo name -> (monotonic time, publish metadata)
+
+        # Push-based build tracking, when a webhook endpoint is configured
+        self._webhook_server = None
+        self._webhook_repos = set()  # repos known to have our hook installed
+        self._webhook_pending_repo = None  # repo whose page_build we are waiting for
+        if WEBHOOK_SECRET and WEBHOOK_PUBLIC_URL:
+            try:
+                self._webhook_server = PageBuildWebhookServer(WEBHOOK_SECRET, WEBHOOK_PORT, self)
+                self._webhook_server.page_build.connect(self._on_page_build_event)
+                self._webhook_server.start()
+            except OSError as e:
+                logger.error(f"Could not start webhook server, falling back to polling: {e}")
+                self._webhook_server = None
         
         # Store current gallery HTML
-        self._current_gallery_html = None
+        self._gallery_images = None  # (thumbnail URL, original URL, file name) of the loaded gallery
+        self._gallery_save_job = None
         self._current_repo_name = None
         
+        # Image upload worker
+        self._upload_thread = None
+        self._upload_worker = None
+        self._upload_repo = None
+        self._upload_total = 0
+
+        # Image download worker
+        self._download_thread = None
+        self._download_worker = None
+
+        # Background fetch of the image table listing
+        self._repo_fetch_job = None
+
         # GitHub Pages build tracker
         self._build_tracker_thread = None
         self._build_tracker_worker = None
@@ -523,12 +1148,12 @@ class MainWindow(QMainWindow):
         center_column.setContentsMargins(6, 6, 6, 6)
         
         # Table view
-        self.image_table = QTableWidget()
-        self.image_table.setColumnCount(5)
-        self.image_table.setHorizontalHeaderLabels(["Name", "Size (KB)", "Orig Size (KB)", "SHA", "Date"])
-        self.image_table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
-        self.image_table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
-        self.image_table.setSelectionMode(QTableWidget.SelectionMode.SingleSelection)
+        self.image_table = QTableView()
+        self.image_rows = ImageRowsModel(self)
+        self.image_table.setModel(self.image_rows)
+        self.image_table.setEditTriggers(QTableView.EditTrigger.NoEditTriggers)
+        self.image_table.setSelectionBehavior(QTableView.SelectionBehavior.SelectRows)
+        self.image_table.setSelectionMode(QTableView.SelectionMode.SingleSelection)
         compact_font = QFont()
         compact_font.setPointSize(9)
         self.image_table.setFont(compact_font)
@@ -539,7 +1164,7 @@ class MainWindow(QMainWindow):
         self.image_table.horizontalHeader().setFont(header_font)
         self.image_table.horizontalHeader().setMinimumHeight(22)
         self.image_table.setColumnHidden(3, True)
-        self.image_table.setStyleSheet("QTableWidget { border: none; padding: 0; margin: 0; } QHeaderView::section { padding: 0; margin: 0; }")
+        self.image_table.setStyleSheet("QTableView { border: none; padding: 0; margin: 0; } QHeaderView::section { padding: 0; margin: 0; }")
         center_column.addWidget(self.image_table)
         
         # Progress bar and upload button layout
@@ -552,10 +1177,16 @@ class MainWindow(QMainWindow):
         self.upload_progress.setFormat('Idle')
         progress_layout.addWidget(self.upload_progress)
         
+        # Per-file dates cost an extra API call per image, so they are opt-in
+        self.show_file_dates_cb = QCheckBox("Show file dates")
+        self.show_file_dates_cb.setToolTip("Look up the last commit date of every image (slower)")
+        self.show_file_dates_cb.toggled.connect(self._on_show_file_dates_toggled)
+        progress_layout.addWidget(self.show_file_dates_cb)
+        
         # Upload button
-        upload_btn = QPushButton("Upload Images")
-        upload_btn.clicked.connect(lambda: self.upload_images_to_repo(self._current_repo_name) if self._current_repo_name else None)
-        progress_layout.addWidget(upload_btn)
+        self.upload_btn = QPushButton("Upload Images")
+        self.upload_btn.clicked.connect(lambda: self.upload_images_to_repo(self._current_repo_name) if self._current_repo_name else None)
+        progress_layout.addWidget(self.upload_btn)
         center_column.addLayout(progress_layout)
         
         # Third Column (Right)
@@ -566,6 +1197,8 @@ class MainWindow(QMainWindow):
         # Web gallery view
         self.web_gallery = QWebEngineView()
         right_column.addWidget(self.web_gallery)
+        self._gallery_scheme_handler = GalleryThumbnailSchemeHandler(self)
+        QWebEngineProfile.defaultProfile().installUrlSchemeHandler(GALLERY_SCHEME, self._gallery_scheme_handler)
         
         # HTML-related buttons
         html_buttons_layout = QHBoxLayout()
@@ -576,7 +1209,7 @@ class MainWindow(QMainWindow):
         
         # Build status indicator
         self.build_status_label = QLabel("Build Status: Not started")
-        self.build_status_label.setStyleSheet("padding: 5px; color: gray; font-size: 11px;")
+        self._set_label_style(self.build_status_label, self._BUILD_STATUS_STYLES['gray'])
         
         # Manual check button
         self.check_build_btn = QPushButton("Check Build Status")
@@ -625,8 +1258,9 @@ class MainWindow(QMainWindow):
 
     def cancel_build_tracking(self):
         """Cancel any ongoing build tracking"""
-        if self._build_tracker_worker is not None:
-            self._build_tracker_worker.cancel()
+        worker = self._build_tracker_worker
+        if worker is not None and not sip.isdeleted(worker):
+            worker.cancel()
         if self._build_tracker_thread is not None:
             try:
                 if self._build_tracker_thread.isRunning():
@@ -635,9 +1269,15 @@ class MainWindow(QMainWindow):
             except RuntimeError:
                 # Thread already deleted
                 pass
+        if worker is not None and not sip.isdeleted(worker):
+            # The thread stopped before the worker could emit finished, so its
+            # deleteLater never runs; release the session and the worker here
+            worker.close()
+            sip.delete(worker)
         self._build_tracker_thread = None
         self._build_tracker_worker = None
         self._build_tracking = False
+        self._webhook_pending_repo = None
 
     def start_build_tracking(self, repo_name):
         """Start tracking GitHub Pages build status"""
@@ -645,11 +1285,11 @@ class MainWindow(QMainWindow):
         
         # Initialize UI for build tracking
         self.build_status_label.setText("Build Status: Starting build tracking...")
-        self.build_status_label.setStyleSheet("padding: 5px; color: blue; font-size: 11px;")
+        self._set_label_style(self.build_status_label, self._BUILD_STATUS_STYLES['blue'])
         self.check_build_btn.setEnabled(True)
         
         self._build_tracker_thread = QThread()
-        self._build_tracker_worker = GitHubPagesBuildTracker(repo_name)
+        self._build_tracker_worker = GitHubPagesBuildTracker(repo_name, self._gh_headers)
         self._build_tracker_worker.moveToThread(self._build_tracker_thread)
         
         # Connect signals
@@ -663,6 +1303,70 @@ class MainWindow(QMainWindow):
         self._build_tracking = True
         self._build_tracker_thread.start()
 
+    def _ensure_repo_webhook(self, repo_name):
+        """Install our page_build hook on the repo if missing - returns whether one is in place"""
+        if self._webhook_server is None:
+            return False
+        if repo_name in self._webhook_repos:
+            return True
+        hooks_url = f'https://api.github.com/repos/lifetime-memories/{repo_name}/hooks'
+        target_url = WEBHOOK_PUBLIC_URL.rstrip('/') + WEBHOOK_PATH
+        try:
+            response = self._session.get(hooks_url, timeout=10)
+            if response.status_code != 200:
+                logger.warning(f"Cannot list webhooks for {repo_name}: {response.status_code}")
+                return False
+            if not any(hook.get('config', {}).get('url') == target_url for hook in response.json()):
+                response = self._session.post(hooks_url, timeout=10, json={
+                    'name': 'web',
+                    'active': True,
+                    'events': ['page_build', 'push'],
+                    'config': {'url': target_url, 'content_type': 'json', 'secret': WEBHOOK_SECRET}
+                })
+                if response.status_code != 201:
+                    logger.warning(f"Failed to create webhook for {repo_name}: {response.status_code}")
+                    return False
+        except Exception as e:
+            logger.error(f"Error setting up webhook for {repo_name}: {e}")
+            return False
+        self._webhook_repos.add(repo_name)
+        return True
+
+    def _wait_for_page_build(self, repo_name):
+        """Wait for a page_build delivery, polling only if none arrives in time"""
+        self.cancel_build_tracking()
+        self._webhook_pending_repo = repo_name
+        self._build_tracking = True
+        self._on_build_status_updated('waiting', 'Waiting for GitHub to report the build...')
+        QTimer.singleShot(WEBHOOK_FALLBACK_DELAY * 1000, lambda: self._webhook_fallback(repo_name))
+
+    def _webhook_fallback(self, repo_name):
+        if self._webhook_pending_repo == repo_name:
+            logger.info(f"No page_build webhook for {repo_name}, polling instead")
+            self._webhook_pending_repo = None
+            self.start_build_tracking(repo_name)
+
+    def _on_page_build_event(self, repo_name, status, error):
+        """Handle a page_build delivery from the webhook server"""
+        logger.info(f"page_build webhook for {repo_name}: {status}")
+        if repo_name != self._webhook_pending_repo:
+            return
+        if status == 'building':
+            self._on_build_status_updated('building', 'Build in progress...')
+        elif status == 'built':
+            self._webhook_pending_repo = None
+            self._on_build_status_updated('success', 'Build completed successfully!')
+            self._on_build_completed(True, f'https://lifetime-memories.github.io/{repo_name}')
+        elif status == 'errored':
+            self._webhook_pending_repo = None
+            self._on_build_status_updated('error', f"Build failed: {error or 'unknown error'}")
+            self._on_build_completed(False, '')
+
+    def _set_label_style(self, label, style):
+        """Apply a stylesheet unless the label already has it; Qt re-parses on every set"""
+        if label.styleSheet() != style:
+            label.setStyleSheet(style)
+
     def _on_build_status_updated(self, status, message):
         """Handle build status updates"""
         logger.info(f"GitHub Pages build status: {status} - {message}")
@@ -678,7 +1382,7 @@ class MainWindow(QMainWindow):
         }
         color = status_colors.get(status, 'gray')
         self.build_status_label.setText(f"Build Status: {message}")
-        self.build_status_label.setStyleSheet(f"padding: 5px; color: {color}; font-size: 11px;")
+        self._set_label_style(self.build_status_label, self._BUILD_STATUS_STYLES[color])
         
         # Enable manual check button
         self.check_build_btn.setEnabled(True)
@@ -702,7 +1406,7 @@ class MainWindow(QMainWindow):
         else:
             self.upload_progress.setFormat(f'Status: {message}')
         
-        QApplication.processEvents()
+        self._pump_ui()
 
     def _on_build_completed(self, success, url):
         """Handle build completion"""
@@ -738,7 +1442,6 @@ class MainWindow(QMainWindow):
         # Reset progress bar
         self.upload_progress.setValue(0)
         self.upload_progress.setFormat('Ready')
-        QApplication.processEvents()
 
     def manual_check_build_status(self):
         """Manually check the current build status"""
@@ -750,16 +1453,11 @@ class MainWindow(QMainWindow):
             self.upload_progress.setFormat('Checking build status...')
             QApplication.processEvents()
             
-            headers = {
-                'Authorization': f"token {os.getenv('GITHUB_TOKEN')}",
-                'Accept': 'application/vnd.github.v3+json'
-            }
-            
             pages_url = f'https://api.github.com/repos/lifetime-memories/{self._current_repo_name}/pages'
-            response = requests.get(pages_url, headers=headers, timeout=10)
+            # Build status must be live; an outage surfaces as an error, not the old status
+            status_code, pages_data = self._cached_get(pages_url, stale_ok=False)
             
-            if response.status_code == 200:
-                pages_data = response.json()
+            if status_code == 200:
                 status = pages_data.get('status', 'unknown')
                 site_url = pages_data.get('html_url', f'https://lifetime-memories.github.io/{self._current_repo_name}')
                 
@@ -776,7 +1474,7 @@ class MainWindow(QMainWindow):
                 
                 # Set color based on status
                 if status == 'built':
-                    self.build_status_label.setStyleSheet("padding: 5px; color: green; font-size: 11px;")
+                    self._set_label_style(self.build_status_label, self._BUILD_STATUS_STYLES['green'])
                     # Ask if user wants to open the site
                     reply = QMessageBox.question(
                         self,
@@ -788,26 +1486,25 @@ class MainWindow(QMainWindow):
                         import webbrowser
                         webbrowser.open(site_url)
                 elif status == 'building':
-                    self.build_status_label.setStyleSheet("padding: 5px; color: orange; font-size: 11px;")
+                    self._set_label_style(self.build_status_label, self._BUILD_STATUS_STYLES['orange'])
                 elif status == 'errored':
-                    self.build_status_label.setStyleSheet("padding: 5px; color: red; font-size: 11px;")
+                    self._set_label_style(self.build_status_label, self._BUILD_STATUS_STYLES['red'])
                 else:
-                    self.build_status_label.setStyleSheet("padding: 5px; color: gray; font-size: 11px;")
+                    self._set_label_style(self.build_status_label, self._BUILD_STATUS_STYLES['gray'])
                     
-            elif response.status_code == 404:
+            elif status_code == 404:
                 self.build_status_label.setText("Build Status: GitHub Pages not enabled")
-                self.build_status_label.setStyleSheet("padding: 5px; color: red; font-size: 11px;")
+                self._set_label_style(self.build_status_label, self._BUILD_STATUS_STYLES['red'])
             else:
-                self.build_status_label.setText(f"Build Status: API Error ({response.status_code})")
-                self.build_status_label.setStyleSheet("padding: 5px; color: red; font-size: 11px;")
+                self.build_status_label.setText(f"Build Status: API Error ({status_code})")
+                self._set_label_style(self.build_status_label, self._BUILD_STATUS_STYLES['red'])
                 
         except Exception as e:
             logger.exception("Error checking build status")
             self.build_status_label.setText(f"Build Status: Error - {str(e)}")
-            self.build_status_label.setStyleSheet("padding: 5px; color: red; font-size: 11px;")
+            self._set_label_style(self.build_status_label, self._BUILD_STATUS_STYLES['red'])
         finally:
             self.upload_progress.setFormat('Ready')
-            QApplication.processEvents()
 
     def set_gallery_black_background(self):
         self.web_gallery.setHtml('<html><body style="background:#222;"></body></html>', QUrl("about:blank"))
@@ -820,13 +1517,8 @@ class MainWindow(QMainWindow):
             if repo_name:
                 try:
                     logger.info(f"Creating new repository: {repo_name}")
-                    headers = {
-                        'Authorization': f"token {os.getenv('GITHUB_TOKEN')}",
-                        'Accept': 'application/vnd.github.v3+json'
-                    }
-                    response = requests.post(
+                    response = self._session.post(
                         'https://api.github.com/orgs/lifetime-memories/repos',
-                        headers=headers,
                         json={
                             'name': repo_name,
                             'private': False,
@@ -862,13 +1554,8 @@ class MainWindow(QMainWindow):
         
         if reply == QMessageBox.StandardButton.Yes:
             try:
-                headers = {
-                    'Authorization': f"token {os.getenv('GITHUB_TOKEN')}",
-                    'Accept': 'application/vnd.github.v3+json'
-                }
-                response = requests.delete(
-                    f'https://api.github.com/repos/lifetime-memories/{repo_name}',
-                    headers=headers
+                response = self._session.delete(
+                    f'https://api.github.com/repos/lifetime-memories/{repo_name}'
                 )
                 
                 if response.status_code == 204:
@@ -885,59 +1572,41 @@ class MainWindow(QMainWindow):
                 QMessageBox.critical(self, "Error", f"An error occurred: {str(e)}")
 
     def upload_images_to_repo(self, repo_name):
+        if self._upload_thread is not None:
+            QMessageBox.information(self, "Upload in Progress", "Please wait for the current upload to finish.")
+            return
         self.set_interactive(False)
         files, _ = QFileDialog.getOpenFileNames(self, "Select JPG Images to Upload", "", "JPEG Images (*.jpg *.jpeg)")
         if not files:
             self.set_interactive(True)
             return
-        headers = {
-            'Authorization': f"token {os.getenv('GITHUB_TOKEN')}",
-            'Accept': 'application/vnd.github.v3+json'
-        }
-        errors = []
-        total = len(files)
         self.upload_progress.setValue(0)
         self.upload_progress.setFormat('Uploading... %p%')
-        for idx, file_path in enumerate(files):
-            try:
-                # Read original image
-                with open(file_path, 'rb') as f:
-                    orig_bytes = f.read()
-                orig_b64 = base64.b64encode(orig_bytes).decode('utf-8')
-                filename = os.path.basename(file_path)
-                # Compress image (max 200x200, JPEG, quality 85)
-                image = Image.open(io.BytesIO(orig_bytes))
-                image = image.convert('RGB')
-                image.thumbnail((200, 200), Image.LANCZOS)
-                buf = io.BytesIO()
-                image.save(buf, format='JPEG', quality=85)
-                thumb_bytes = buf.getvalue()
-                thumb_b64 = base64.b64encode(thumb_bytes).decode('utf-8')
-                # Upload original image to repo root
-                put_url = f'https://api.github.com/repos/lifetime-memories/{repo_name}/contents/{filename}'
-                put_data = {
-                    'message': f'Upload {filename}',
-                    'content': orig_b64
-                }
-                put_resp = requests.put(put_url, headers=headers, json=put_data)
-                if put_resp.status_code not in (201, 200):
-                    errors.append(f"Failed to upload {filename}: {put_resp.status_code}")
-                    continue
-                # Upload compressed image to thumbnails/
-                thumb_url = f'https://api.github.com/repos/lifetime-memories/{repo_name}/contents/thumbnails/{filename}'
-                thumb_data = {
-                    'message': f'Upload thumbnail {filename}',
-                    'content': thumb_b64
-                }
-                thumb_resp = requests.put(thumb_url, headers=headers, json=thumb_data)
-                if thumb_resp.status_code not in (201, 200):
-                    errors.append(f"Failed to upload thumbnail for {filename}: {thumb_resp.status_code}")
-                    continue
-            except Exception as e:
-                errors.append(f"Error with {file_path}: {str(e)}")
-            # Update progress bar
-            self.upload_progress.setValue(int((idx + 1) / total * 100))
-            QApplication.processEvents()
+        self._upload_repo = repo_name
+        self._upload_total = len(files)
+        # Upload on a worker thread so the window stays responsive
+        self._upload_thread = QThread()
+        self._upload_worker = ImageUploadWorker(repo_name, files, self._gh_headers)
+        self._upload_worker.moveToThread(self._upload_thread)
+        self._upload_thread.started.connect(self._upload_worker.run)
+        self._upload_worker.progress.connect(self._on_upload_progress)
+        self._upload_worker.upload_finished.connect(self._on_upload_finished)
+        self._upload_worker.finished.connect(self._upload_thread.quit)
+        self._upload_worker.finished.connect(self._upload_worker.deleteLater)
+        self._upload_thread.finished.connect(self._upload_thread.deleteLater)
+        # Drop our references only once the thread has really stopped
+        self._upload_thread.finished.connect(self._on_upload_thread_finished)
+        self._upload_thread.start()
+
+    def _on_upload_thread_finished(self):
+        self._upload_thread = None
+        self._upload_worker = None
+
+    def _on_upload_progress(self, done):
+        self.upload_progress.setValue(int(done / self._upload_total * 100))
+
+    def _on_upload_finished(self, errors):
+        repo_name = self._upload_repo
         self.upload_progress.setValue(0)
         self.upload_progress.setFormat('Idle')
         if errors:
@@ -975,73 +1644,96 @@ class MainWindow(QMainWindow):
                 
             menu.exec(self.repo_list.mapToGlobal(position))
 
+    def _get_repo_meta(self, repo_name):
+        """Default branch and Pages state for publishing, reused for REPO_META_TTL seconds"""
+        cached = self._repo_meta_cache.get(repo_name)
+        if cached and time.monotonic() - cached[0] < REPO_META_TTL:
+            return cached[1]
+        repo_response = self._session.get(f'https://api.github.com/repos/lifetime-memories/{repo_name}')
+        if repo_response.status_code != 200:
+            raise Exception(f"Failed to get repository info: {repo_response.status_code}")
+        # Pages and gh-pages state are filled in lazily by publish_to_github_pages
+        meta = {
+            'default_branch': repo_response.json()['default_branch'],
+            'pages_enabled': False,
+            'gh_pages_exists': None,
+        }
+        self._repo_meta_cache[repo_name] = (time.monotonic(), meta)
+        return meta
+
     def publish_to_github_pages(self, repo_name):
         """Publish the gallery to GitHub Pages"""
-        if not self._current_gallery_html:
+        if not self._gallery_images:
             QMessageBox.warning(self, "Warning", "Please load the repository images first.")
             return
 
         try:
             self.upload_progress.setValue(0)
             self.upload_progress.setFormat('Publishing to GitHub Pages...')
-            QApplication.processEvents()
+            self._pump_ui()
 
-            # First, enable GitHub Pages if not already enabled
-            headers = {
-                'Authorization': f"token {os.getenv('GITHUB_TOKEN')}",
-                'Accept': 'application/vnd.github.v3+json'
-            }
+            meta = self._get_repo_meta(repo_name)
 
-            # Enable GitHub Pages
             pages_settings = {
                 'source': {
                     'branch': 'gh-pages',
                     'path': '/'
                 }
             }
-            
-            pages_url = f'https://api.github.com/repos/lifetime-memories/{repo_name}/pages'
-            pages_response = requests.post(pages_url, headers=headers, json=pages_settings)
-            
-            # Get the current commit SHA of the default branch
-            repo_response = requests.get(f'https://api.github.com/repos/lifetime-memories/{repo_name}', headers=headers)
-            if repo_response.status_code != 200:
-                raise Exception(f"Failed to get repository info: {repo_response.status_code}")
-            
-            repo_data = repo_response.json()
-            default_branch = repo_data['default_branch']
-            
-            # Get the latest commit SHA
-            branch_response = requests.get(
-                f'https://api.github.com/repos/lifetime-memories/{repo_name}/git/refs/heads/{default_branch}',
-                headers=headers
-            )
+            blob_data = {
+                'content': _build_gallery_html(self._current_repo_name or 'Image Gallery', self._gallery_images),
+                'encoding': 'utf-8'
+            }
+            # Enabling Pages, both ref lookups and the blob upload don't depend on
+            # each other, so they go out together; only tree -> commit -> ref is ordered
+            with concurrent.futures.ThreadPoolExecutor(max_workers=4) as executor:
+                # Enable GitHub Pages if not already enabled
+                pages_future = None
+                if not meta['pages_enabled']:
+                    pages_future = executor.submit(
+                        self._session.post,
+                        f'https://api.github.com/repos/lifetime-memories/{repo_name}/pages',
+                        json=pages_settings
+                    )
+                # Get the latest commit SHA; never cached, uploads move it
+                branch_future = executor.submit(
+                    self._session.get,
+                    f"https://api.github.com/repos/lifetime-memories/{repo_name}/git/refs/heads/{meta['default_branch']}"
+                )
+                # Check whether the gh-pages branch exists yet
+                gh_pages_future = None
+                if meta['gh_pages_exists'] is None:
+                    gh_pages_future = executor.submit(
+                        self._session.get,
+                        f'https://api.github.com/repos/lifetime-memories/{repo_name}/git/refs/heads/gh-pages'
+                    )
+                # Create a blob with the HTML content
+                blob_future = executor.submit(
+                    self._session.post,
+                    f'https://api.github.com/repos/lifetime-memories/{repo_name}/git/blobs',
+                    json=blob_data
+                )
+
+            if pages_future is not None:
+                # 409 means Pages is already enabled
+                meta['pages_enabled'] = pages_future.result().status_code in (201, 409)
+
+            branch_response = branch_future.result()
             if branch_response.status_code != 200:
+                # The default branch may have been renamed since it was cached
+                self._repo_meta_cache.pop(repo_name, None)
                 raise Exception(f"Failed to get branch info: {branch_response.status_code}")
             
             base_sha = branch_response.json()['object']['sha']
 
-            # Create or update gh-pages branch
-            try:
-                # Try to get gh-pages ref
-                gh_pages_response = requests.get(
-                    f'https://api.github.com/repos/lifetime-memories/{repo_name}/git/refs/heads/gh-pages',
-                    headers=headers
-                )
-                gh_pages_exists = gh_pages_response.status_code == 200
-            except:
-                gh_pages_exists = False
+            if gh_pages_future is not None:
+                try:
+                    meta['gh_pages_exists'] = gh_pages_future.result().status_code == 200
+                except Exception:
+                    meta['gh_pages_exists'] = False
+            gh_pages_exists = meta['gh_pages_exists']
 
-            # Create a blob with the HTML content
-            blob_data = {
-                'content': self._current_gallery_html,
-                'encoding': 'utf-8'
-            }
-            blob_response = requests.post(
-                f'https://api.github.com/repos/lifetime-memories/{repo_name}/git/blobs',
-                headers=headers,
-                json=blob_data
-            )
+            blob_response = blob_future.result()
             if blob_response.status_code != 201:
                 raise Exception(f"Failed to create blob: {blob_response.status_code}")
             
@@ -1057,9 +1749,8 @@ class MainWindow(QMainWindow):
                     'sha': blob_sha
                 }]
             }
-            tree_response = requests.post(
+            tree_response = self._session.post(
                 f'https://api.github.com/repos/lifetime-memories/{repo_name}/git/trees',
-                headers=headers,
                 json=tree_data
             )
             if tree_response.status_code != 201:
@@ -1073,9 +1764,8 @@ class MainWindow(QMainWindow):
                 'tree': tree_sha,
                 'parents': [base_sha]
             }
-            commit_response = requests.post(
+            commit_response = self._session.post(
                 f'https://api.github.com/repos/lifetime-memories/{repo_name}/git/commits',
-                headers=headers,
                 json=commit_data
             )
             if commit_response.status_code != 201:
@@ -1090,9 +1780,8 @@ class MainWindow(QMainWindow):
                     'sha': new_commit_sha,
                     'force': True
                 }
-                ref_response = requests.patch(
+                ref_response = self._session.patch(
                     f'https://api.github.com/repos/lifetime-memories/{repo_name}/git/refs/heads/gh-pages',
-                    headers=headers,
                     json=ref_data
                 )
             else:
@@ -1101,34 +1790,38 @@ class MainWindow(QMainWindow):
                     'ref': 'refs/heads/gh-pages',
                     'sha': new_commit_sha
                 }
-                ref_response = requests.post(
+                ref_response = self._session.post(
                     f'https://api.github.com/repos/lifetime-memories/{repo_name}/git/refs',
-                    headers=headers,
                     json=ref_data
                 )
 
             if ref_response.status_code not in [200, 201]:
+                # The cached branch state was wrong (e.g. gh-pages deleted); re-read it next time
+                self._repo_meta_cache.pop(repo_name, None)
                 raise Exception(f"Failed to update gh-pages branch: {ref_response.status_code}")
+            meta['gh_pages_exists'] = True
 
             # Content published successfully, now start tracking the build
             self.upload_progress.setFormat('Content published! Starting build tracking...')
             self.upload_progress.setValue(25)
-            QApplication.processEvents()
+            self._pump_ui()
             
-            # Start the build tracker
-            self.start_build_tracking(repo_name)
+            # Start the build tracker; a webhook delivery replaces polling when available
+            if self._ensure_repo_webhook(repo_name):
+                self._wait_for_page_build(repo_name)
+            else:
+                self.start_build_tracking(repo_name)
 
         except Exception as e:
             logger.exception("Error publishing to GitHub Pages")
             QMessageBox.critical(self, "Error", f"Failed to publish to GitHub Pages: {str(e)}")
             self.upload_progress.setValue(0)
             self.upload_progress.setFormat('Ready')
-            QApplication.processEvents()
 
     def reset_build_status(self):
         """Reset build status display"""
         self.build_status_label.setText("Build Status: Not started")
-        self.build_status_label.setStyleSheet("padding: 5px; color: gray; font-size: 11px;")
+        self._set_label_style(self.build_status_label, self._BUILD_STATUS_STYLES['gray'])
         self.check_build_btn.setEnabled(False)
         self.cancel_build_tracking()
 
@@ -1139,24 +1832,28 @@ class MainWindow(QMainWindow):
         
         self.load_and_display_images(repo_name)
         # Fetch thumbnails and update HTML gallery
-        headers = {
-            'Authorization': f"token {os.getenv('GITHUB_TOKEN')}",
-            'Accept': 'application/vnd.github.v3+json'
-        }
         try:
-            response = requests.get(
-                f'https://api.github.com/repos/lifetime-memories/{repo_name}/contents/thumbnails',
-                headers=headers
+            # The whole tree in one call; HEAD resolves to the default branch
+            status_code, tree = self._cached_get(
+                f'https://api.github.com/repos/lifetime-memories/{repo_name}/git/trees/HEAD?recursive=1'
             )
-            if response.status_code == 200:
-                thumbnails = response.json()
-                image_pairs = []
-                for thumb in thumbnails:
-                    if thumb['type'] == 'file':
-                        thumb_url = thumb['download_url']
-                        orig_url = thumb_url.replace('/thumbnails/', '/')
-                        image_pairs.append((thumb_url, orig_url))
-                html = self._generate_gallery_html(image_pairs)
+            if status_code == 200:
+                raw_base = f'https://raw.githubusercontent.com/lifetime-memories/{repo_name}/HEAD/'
+                images = []
+                local_images = []
+                self._gallery_scheme_handler.reset()
+                for entry in tree.get('tree', []):
+                    path = entry['path']
+                    if entry['type'] == 'blob' and path.startswith('thumbnails/'):
+                        # Originals sit at the same path without the thumbnails/ prefix
+                        thumb_url = raw_base + quote(path)
+                        orig_url = raw_base + quote(path[len('thumbnails/'):])
+                        filename = path.rpartition('/')[2]
+                        images.append((thumb_url, orig_url, filename))
+                        local_images.append((self._gallery_scheme_handler.local_url(entry['sha'], thumb_url), orig_url, filename))
+                # The saved/published page keeps GitHub URLs; the in-app view reads the local cache
+                self._generate_gallery_html(images)
+                html = _build_gallery_html(self._current_repo_name or 'Image Gallery', local_images)
                 
                 # Set up web channel before loading HTML
                 self.web_gallery.page().setWebChannel(self.web_channel)
@@ -1170,28 +1867,22 @@ class MainWindow(QMainWindow):
         self.repo_list.setEnabled(enabled)
         self.image_table.setEnabled(enabled)
         self.create_repo_btn.setEnabled(enabled)
+        self.upload_btn.setEnabled(enabled)
         # If you have other header buttons, disable them here as well
         # Optionally, disable the main window itself: self.setEnabled(enabled)
 
     def refresh_repositories(self):
         logger.info("Refreshing repositories")
         self.repo_list.clear()
-        self.image_table.setRowCount(0)
+        self.image_rows.set_rows([])
         try:
-            headers = {
-                'Authorization': f"token {os.getenv('GITHUB_TOKEN')}",
-                'Accept': 'application/vnd.github.v3+json'
-            }
-            response = requests.get(
-                'https://api.github.com/orgs/lifetime-memories/repos',
-                headers=headers
-            )
-            if response.status_code == 200:
-                self.repositories = response.json()
+            status_code, repositories = self._cached_get_all_pages('https://api.github.com/orgs/lifetime-memories/repos')
+            if status_code == 200:
+                self.repositories = repositories
                 self.display_repositories()
                 logger.info(f"Successfully fetched {len(self.repositories)} repositories")
             else:
-                error_msg = f"Failed to fetch repositories. Status code: {response.status_code}"
+                error_msg = f"Failed to fetch repositories. Status code: {status_code}"
                 logger.error(error_msg)
                 QMessageBox.critical(self, "Error", error_msg)
         except Exception as e:
@@ -1200,27 +1891,116 @@ class MainWindow(QMainWindow):
 
     def display_repositories(self):
         logger.info("Displaying repositories in list")
-        for repo in self.repositories:
-            item = QListWidgetItem(repo['name'])
-            item.setData(Qt.ItemDataRole.UserRole, repo)
-            # Add tooltip to show that double-click loads the repository
-            item.setToolTip("Double-click to load repository")
-            self.repo_list.addItem(item)
-        # Resize QListWidget to fit contents
-        max_width = 0
-        for i in range(self.repo_list.count()):
-            item = self.repo_list.item(i)
-            width = self.repo_list.fontMetrics().horizontalAdvance(item.text())
-            if width > max_width:
-                max_width = width
+        # Populate without intermediate repaints or per-item signals
+        self.repo_list.setUpdatesEnabled(False)
+        self.repo_list.blockSignals(True)
+        try:
+            metrics = self.repo_list.fontMetrics()
+            max_width = 0
+            for repo in self.repositories:
+                item = QListWidgetItem(repo['name'])
+                item.setData(Qt.ItemDataRole.UserRole, repo)
+                # Add tooltip to show that double-click loads the repository
+                item.setToolTip("Double-click to load repository")
+                self.repo_list.addItem(item)
+                # Measure while adding, for resizing the list to fit its contents
+                max_width = max(max_width, metrics.horizontalAdvance(repo['name']))
+        finally:
+            self.repo_list.blockSignals(False)
+            self.repo_list.setUpdatesEnabled(True)
         self.repo_list.setMinimumWidth(max_width + 40)
         self.repo_list.updateGeometry()
 
+    def _conditional_get(self, url, headers=None, timeout=10, cache=True, stale_ok=True):
+        """GET with If-None-Match from etag_cache - returns (response, cached entry)
+
+        The response is None when GitHub can't be reached or fails but a cached
+        copy exists; callers then serve that copy, so viewed repos work offline.
+        Status endpoints pass stale_ok=False so an outage isn't shown as current
+        state. With cache=False the request is sent plainly and nothing is cached.
+        """
+        # Extra headers are merged over the session's auth headers
+        headers = dict(headers or {})
+        cached = etag_cache.get(url) if cache else None
+        if cached:
+            headers['If-None-Match'] = cached[0]
+        try:
+            response = self._session.get(url, headers=headers, timeout=timeout)
+        except requests.RequestException as e:
+            if not (cached and stale_ok):
+                raise
+            logger.warning(f"Serving cached {url}, request failed: {e}")
+            return None, cached
+        if response.status_code >= 500 and cached and stale_ok:
+            logger.warning(f"Serving cached {url}, GitHub answered {response.status_code}")
+            return None, cached
+        return response, cached
+
+    def _cached_get(self, url, stale_ok=True):
+        """GET JSON, revalidating a cached copy with If-None-Match - returns (status code, data)"""
+        response, cached = self._conditional_get(url, stale_ok=stale_ok)
+        # 304s are not counted against the rate limit
+        if response is None or response.status_code == 304:
+            return 200, cached[1]
+        if response.status_code != 200:
+            return response.status_code, None
+        data = _response_json(response)
+        etag = response.headers.get('ETag')
+        if etag:
+            etag_cache.set(url, etag, data)
+        return 200, data
+
+    def _cached_get_all_pages(self, url):
+        """GET every page of a list endpoint, 100 per page, fetching the rest in parallel - returns (status code, items)"""
+        first_url = f'{url}?per_page=100'
+        response, cached = self._conditional_get(first_url)
+        if response is None or response.status_code == 304:
+            items, last_page = cached[1]
+        elif response.status_code == 200:
+            items = _response_json(response)
+            last_url = response.links.get('last', {}).get('url')
+            last_page = int(parse_qs(urlparse(last_url).query)['page'][0]) if last_url else 1
+            # A 304 carries no Link header, so the page count is cached with the first page
+            etag = response.headers.get('ETag')
+            if etag:
+                etag_cache.set(first_url, etag, [items, last_page])
+        else:
+            return response.status_code, None
+        items = list(items)  # don't extend the cached first page in place
+        if last_page > 1:
+            page_urls = [f'{first_url}&page={page}' for page in range(2, last_page + 1)]
+            max_workers = min(GITHUB_MAX_CONCURRENCY, len(page_urls))
+            with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+                for status_code, page_items in executor.map(self._cached_get, page_urls):
+                    if status_code != 200:
+                        return status_code, None
+                    items.extend(page_items)
+        # A cached page count can be stale; keep going while pages come back full
+        page = last_page
+        while len(items) == page * 100:
+            page += 1
+            status_code, page_items = self._cached_get(f'{first_url}&page={page}')
+            if status_code != 200 or not page_items:
+                break
+            items.extend(page_items)
+        return 200, items
+
+    def closeEvent(self, event):
+        etag_cache.save()
+        if self._webhook_server is not None:
+            self._webhook_server.stop()
+        super().closeEvent(event)
+
     def _check_rate_limit(self, response):
         """Check and update rate limit info from response headers"""
         try:
-            self._rate_limit_remaining = int(response.headers.get('X-RateLimit-Remaining', 0))
-            reset_time = int(response.headers.get('X-RateLimit-Reset', 0))
+            # Nothing to do when the counters haven't moved (e.g. 304s, cached calls)
+            rate_headers = (response.headers.get('X-RateLimit-Remaining'), response.headers.get('X-RateLimit-Reset'))
+            if rate_headers == self._last_rate_headers:
+                return
+            self._last_rate_headers = rate_headers
+            self._rate_limit_remaining = int(rate_headers[0] or 0)
+            reset_time = int(rate_headers[1] or 0)
             self._rate_limit_reset = datetime.fromtimestamp(reset_time)
             
             # Update the GUI display
@@ -1229,14 +2009,16 @@ class MainWindow(QMainWindow):
             if self._rate_limit_remaining < 100:  # Warning threshold
                 reset_time_str = self._rate_limit_reset.strftime('%Y-%m-%d %H:%M:%S')
                 logger.warning(f"GitHub API rate limit low: {self._rate_limit_remaining} remaining, resets at {reset_time_str}")
-                if self._rate_limit_remaining < 10:  # Critical threshold
-                    QMessageBox.warning(self, "Rate Limit Warning", 
-                        f"GitHub API rate limit is very low ({self._rate_limit_remaining} remaining).\n"
-                        f"Limit will reset at {reset_time_str}")
+                # Critical threshold; warn once per reset window, after the caller returns
+                if self._rate_limit_remaining < 10 and self._rate_limit_warned_reset != reset_time:
+                    self._rate_limit_warned_reset = reset_time
+                    message = (f"GitHub API rate limit is very low ({self._rate_limit_remaining} remaining).\n"
+                               f"Limit will reset at {reset_time_str}")
+                    QTimer.singleShot(0, lambda: QMessageBox.warning(self, "Rate Limit Warning", message))
         except Exception as e:
             logger.error(f"Error checking rate limit: {e}")
             self.rate_limit_label.setText("Rate limit: Unknown")
-            self.rate_limit_label.setStyleSheet("padding: 5px; color: gray;")
+            self._set_label_style(self.rate_limit_label, self._RATE_LIMIT_STYLES['gray'])
 
     def update_rate_limit_display(self):
         """Update the rate limit display in the status bar"""
@@ -1261,18 +2043,22 @@ class MainWindow(QMainWindow):
                     color = "green"
                 
                 self.rate_limit_label.setText(display_text)
-                self.rate_limit_label.setStyleSheet(f"padding: 5px; color: {color};")
+                self._set_label_style(self.rate_limit_label, self._RATE_LIMIT_STYLES[color])
             else:
                 self.rate_limit_label.setText("Rate limit: Not yet fetched")
-                self.rate_limit_label.setStyleSheet("padding: 5px; color: gray;")
+                self._set_label_style(self.rate_limit_label, self._RATE_LIMIT_STYLES['gray'])
         except Exception as e:
             logger.error(f"Error updating rate limit display: {e}")
             self.rate_limit_label.setText("Rate limit: Error")
-            self.rate_limit_label.setStyleSheet("padding: 5px; color: red;")
+            self._set_label_style(self.rate_limit_label, self._RATE_LIMIT_STYLES['red'])
 
     @pyqtSlot(str, str)
     def downloadImage(self, url, filename):
         """Handle image download with native file dialog"""
+        if self._download_thread is not None:
+            # A double click or long press can fire again while one is running
+            logger.info(f"Ignoring download of {filename}; another download is in progress")
+            return
         try:
             # Show save file dialog
             file_path, _ = QFileDialog.getSaveFileName(
@@ -1283,32 +2069,49 @@ class MainWindow(QMainWindow):
             )
             
             if file_path:
-                # Download the image
-                headers = {
-                    'Authorization': f"token {os.getenv('GITHUB_TOKEN')}",
-                    'Accept': 'application/vnd.github.v3+json'
-                }
-                response = requests.get(url, headers=headers, stream=True)
-                
-                if response.status_code == 200:
-                    with open(file_path, 'wb') as f:
-                        for chunk in response.iter_content(chunk_size=8192):
-                            if chunk:
-                                f.write(chunk)
-                    QMessageBox.information(self, "Success", "Image downloaded successfully!")
-                else:
-                    QMessageBox.critical(self, "Error", f"Failed to download image: {response.status_code}")
+                # Download on a worker thread so large images don't freeze the window
+                self.upload_progress.setValue(0)
+                self.upload_progress.setFormat('Downloading... %p%')
+                self._download_thread = QThread()
+                self._download_worker = ImageDownloadWorker(url, file_path, self._gh_headers)
+                self._download_worker.moveToThread(self._download_thread)
+                self._download_thread.started.connect(self._download_worker.run)
+                self._download_worker.progress.connect(self._on_download_progress)
+                self._download_worker.download_finished.connect(self._on_download_finished)
+                self._download_worker.finished.connect(self._download_thread.quit)
+                self._download_worker.finished.connect(self._download_worker.deleteLater)
+                self._download_thread.finished.connect(self._download_thread.deleteLater)
+                # Drop our references only once the thread has really stopped
+                self._download_thread.finished.connect(self._on_download_thread_finished)
+                self._download_thread.start()
         except Exception as e:
             logger.exception("Error downloading image")
             QMessageBox.critical(self, "Error", f"Failed to download image: {str(e)}")
 
+    def _on_download_progress(self, done, total):
+        if total:
+            self.upload_progress.setValue(int(done / total * 100))
+
+    def _on_download_thread_finished(self):
+        self._download_thread = None
+        self._download_worker = None
+
+    def _on_download_finished(self, error):
+        self.upload_progress.setValue(0)
+        self.upload_progress.setFormat('Idle')
+        if error:
+            QMessageBox.critical(self, "Error", error)
+        else:
+            QMessageBox.information(self, "Success", "Image downloaded successfully!")
+
     def refresh_rate_limit(self):
         """Manually refresh the rate limit information"""
         try:
             self.upload_progress.setFormat('Checking rate limit...')
             QApplication.processEvents()
             
-            response = self._make_github_request('https://api.github.com/rate_limit')
+            # Always current, and not counted against the limit anyway
+            response = self._make_github_request('https://api.github.com/rate_limit', cache=False)
             if response.status_code == 200:
                 rate_data = response.json()
                 self._rate_limit_remaining = rate_data['rate']['remaining']
@@ -1322,22 +2125,36 @@ class MainWindow(QMainWindow):
             logger.error(f"Error refreshing rate limit: {e}")
             self.upload_progress.setFormat('Error checking rate limit')
         finally:
-            QApplication.processEvents()
             # Reset progress bar after a short delay
             QTimer.singleShot(2000, lambda: self.upload_progress.setFormat('Idle'))
 
-    def _make_github_request(self, url, headers=None):
-        """Make a GitHub API request with rate limit checking"""
-        if not headers:
-            headers = {
-                'Authorization': f"token {os.getenv('GITHUB_TOKEN')}",
-                'Accept': 'application/vnd.github.v3+json'
-            }
-        
-        try:
-            response = requests.get(url, headers=headers)
-            self._check_rate_limit(response)
-            return response
+    def _pump_ui(self):
+        """Flush pending events at most 20 times a second during progress updates"""
+        now = time.monotonic()
+        if now - self._last_pump > UI_PUMP_INTERVAL:
+            QApplication.processEvents()
+            self._last_pump = now
+
+    def _make_github_request(self, url, headers=None, cache=True):
+        """Make a GitHub API request with rate limit checking; safe to call from pool threads
+
+        Pass cache=False for volatile or one-off URLs that shouldn't take space in etag_cache.
+        """
+        try:
+            response, cached = self._conditional_get(url, headers, GITHUB_API_TIMEOUT, cache)
+            if response is None:
+                return _CachedResponse(cached[1])
+            # Direct call on the GUI thread, queued to it from anywhere else
+            self._rate_limit_response.emit(response)
+            if response.status_code == 304:
+                # Unchanged and not counted against the rate limit
+                return _CachedResponse(cached[1], response.headers)
+            if cache and response.status_code == 200 and response.headers.get('ETag'):
+                # Decode once; callers read the same parsed body through the wrapper
+                data = _response_json(response)
+                etag_cache.set(url, response.headers['ETag'], data)
+                return _CachedResponse(data, response.headers)
+            return response
         except Exception as e:
             logger.error(f"Error making GitHub request to {url}: {e}")
             raise
@@ -1350,7 +2167,7 @@ class MainWindow(QMainWindow):
         self.reset_build_status()
         
         self.set_interactive(False)
-        self.image_table.setRowCount(0)
+        self.image_rows.set_rows([])
         if not repo_name:
             self.set_interactive(True)
             return
@@ -1358,111 +2175,197 @@ class MainWindow(QMainWindow):
         # Reset and show progress bar
         self.upload_progress.setValue(0)
         self.upload_progress.setFormat('Fetching repository data...')
-        QApplication.processEvents()
         
-        try:
-            # Get thumbnails list
-            response = self._make_github_request(
+        # Fetch on a pool thread; the table is filled when the result comes back
+        with_dates = self.show_file_dates_cb.isChecked()
+        job = _RepoFetchJob(lambda report: self._fetch_repo_listing(repo_name, with_dates, report))
+        job.signals.fetched.connect(self._populate_table_from_fetch)
+        job.signals.progress.connect(self._on_repo_fetch_progress)
+        job.signals.error.connect(self._on_repo_fetch_error)
+        self._repo_fetch_job = job  # keeps the signals object alive until delivery
+        QThreadPool.globalInstance().start(job)
+
+    def _fetch_repo_listing(self, repo_name, with_dates, report):
+        """Fetch everything the image table needs; runs on a pool thread"""
+        # Both listings in one GraphQL round trip; REST if that isn't possible
+        fetched = self._graphql_fetch_repo(repo_name)
+        if fetched is not None:
+            status_code = 200
+            thumbnails, orig_sizes = fetched
+        else:
+            # Get thumbnails list and original file metadata in parallel
+            thumbs_future = _GITHUB_EXECUTOR.submit(
+                self._make_github_request,
                 f'https://api.github.com/repos/lifetime-memories/{repo_name}/contents/thumbnails'
             )
-            
-            if response.status_code == 200:
-                thumbnails = response.json()
+            orig_future = _GITHUB_EXECUTOR.submit(
+                self._make_github_request,
+                f'https://api.github.com/repos/lifetime-memories/{repo_name}/contents'
+            )
+            response = thumbs_future.result()
+            status_code = response.status_code
+            thumbnails = response.json() if status_code == 200 else None
+            orig_sizes = {}
+            if thumbnails:
+                orig_response = orig_future.result()
+                if orig_response.status_code == 200:
+                    # Only the size is needed from each entry
+                    orig_sizes = {f['name']: f['size'] for f in orig_response.json() if f.get('type') == 'file'}
+
+        if thumbnails:
+            # Only files become rows; drop folders here, off the GUI thread
+            thumbnails = [thumb for thumb in thumbnails if thumb['type'] == 'file']
+
+        # Per-file commit dates are only fetched on request; otherwise
+        # the repository's last push time is shown as a coarse date
+        file_commits = {}
+        if with_dates and thumbnails:
+            report(50, f'Fetching dates for {len(thumbnails)} files...')
+            file_commits = self._fetch_file_commit_dates(repo_name, [thumb['name'] for thumb in thumbnails])
+        return {
+            'repo_name': repo_name,
+            'status_code': status_code,
+            'thumbnails': thumbnails,
+            'orig_sizes': orig_sizes,
+            'file_commits': file_commits,
+        }
+
+    def _on_repo_fetch_progress(self, value, text):
+        if self._repo_fetch_job is not None and self.sender() is self._repo_fetch_job.signals:
+            self.upload_progress.setValue(value)
+            self.upload_progress.setFormat(text)
+
+    def _on_repo_fetch_error(self, message):
+        # Ignore failures of fetches superseded by a later repository switch
+        if self._repo_fetch_job is not None and self.sender() is self._repo_fetch_job.signals:
+            self._handle_error(message)
+
+    def _populate_table_from_fetch(self, result):
+        """Fill the image table from a _fetch_repo_listing result"""
+        repo_name = result['repo_name']
+        if repo_name != self._current_repo_name:
+            return  # another repository was opened while this one loaded
+        status_code = result['status_code']
+        thumbnails = result['thumbnails']
+        try:
+            if status_code == 200:
                 self._last_thumbnails = thumbnails
                 if thumbnails:
                     total_images = len(thumbnails)
-                    self.image_table.setRowCount(total_images)
                     self.upload_progress.setFormat(f'Loading metadata for {total_images} images... %p%')
-                    QApplication.processEvents()
-                    
-                    # Batch fetch original file metadata
-                    orig_files_url = f'https://api.github.com/repos/lifetime-memories/{repo_name}/contents'
-                    orig_response = self._make_github_request(orig_files_url)
-                    if orig_response.status_code == 200:
-                        orig_files = {f['name']: f for f in orig_response.json()}
-                    else:
-                        orig_files = {}
-                    
-                    # Batch fetch commit history for all files
-                    commits_url = f'https://api.github.com/repos/lifetime-memories/{repo_name}/commits'
-                    commits_response = self._make_github_request(f"{commits_url}?per_page=100")
-                    if commits_response.status_code == 200:
-                        commits_data = commits_response.json()
-                        # Create a map of filename to latest commit
-                        file_commits = {}
-                        for commit in commits_data:
-                            if 'files' in commit:
-                                for file in commit['files']:
-                                    filename = file['filename'].split('/')[-1]
-                                    if filename not in file_commits:
-                                        file_commits[filename] = commit['commit']['committer']['date']
-                    else:
-                        file_commits = {}
                     
-                    row = 0
-                    completed_images = 0
+                    orig_sizes = result['orig_sizes']
+                    file_commits = result['file_commits']
+                    repo_date_str = self._get_repo_pushed_at(repo_name)
                     
+                    # The listing holds files only, one row each
+                    rows = []
                     for thumb in thumbnails:
-                        if thumb['type'] == 'file':
-                            filename = thumb['name']
-                            name_item = QTableWidgetItem(filename)
-                            size_kb = thumb['size'] / 1024
-                            size_item = QTableWidgetItem(f"{size_kb:.1f}")
-                            
-                            # Get original file size from batch request
-                            orig_size_kb = "-"
-                            if filename in orig_files:
-                                orig_size_kb = f"{orig_files[filename]['size'] / 1024:.1f}"
-                            orig_size_item = QTableWidgetItem(str(orig_size_kb))
-                            
-                            # Get commit date from batch request
-                            date_str = "-"
-                            if filename in file_commits:
-                                dt = datetime.fromisoformat(file_commits[filename].replace('Z', '+00:00'))
-                                date_str = dt.strftime('%Y-%m-%d %H:%M')
-                            date_item = QTableWidgetItem(date_str)
-                            
-                            self.image_table.setItem(row, 0, name_item)
-                            self.image_table.setItem(row, 1, size_item)
-                            self.image_table.setItem(row, 2, orig_size_item)
-                            self.image_table.setItem(row, 4, date_item)
-                            
-                            row += 1
+                        filename = thumb['name']
+                        size_kb = thumb['size'] / 1024
+                        
+                        # Get original file size from batch request
+                        orig_size_kb = "-"
+                        if filename in orig_sizes:
+                            orig_size_kb = f"{orig_sizes[filename] / 1024:.1f}"
+                        
+                        # Get commit date from batch request, already formatted
+                        date_str = file_commits.get(filename, repo_date_str)
+                        
+                        rows.append((filename, f"{size_kb:.1f}", orig_size_kb, "", date_str))
                     
-                    self.image_table.setRowCount(row)
+                    # One model reset instead of a signal per cell
+                    self.image_rows.set_rows(rows)
                     self.image_table.resizeColumnsToContents()
                     
-                    self.upload_progress.setFormat('Loading gallery view...')
-                    QApplication.processEvents()
-                    
                     self.set_interactive(True)
                     self.web_gallery.setVisible(True)
-                    if row > 1 or (row == 1 and self.image_table.item(0, 0) and self.image_table.item(0, 0).text() != "No images uploaded yet."):
-                        self.splitter.setStretchFactor(1, 3)
-                        self.splitter.setStretchFactor(2, 5)
-                    else:
-                        self.splitter.setStretchFactor(1, 4)
-                        self.splitter.setStretchFactor(2, 4)
+                    self.splitter.setStretchFactor(1, 3)
+                    self.splitter.setStretchFactor(2, 5)
                     
                     self.upload_progress.setValue(100)
                     self.upload_progress.setFormat('Ready')
-                    QApplication.processEvents()
                 else:
                     self._handle_empty_repository()
-            elif response.status_code == 404:
+            elif status_code == 404:
                 self._handle_empty_repository()
             else:
-                self._handle_error(f"Failed to load images. Status code: {response.status_code}")
+                self._handle_error(f"Failed to load images. Status code: {status_code}")
         except Exception as e:
             self._handle_error(f"An error occurred: {str(e)}")
 
+    def _graphql_fetch_repo(self, repo_name):
+        """Fetch the thumbnail listing and original sizes in one GraphQL query - returns (thumbnails, sizes) or None"""
+        try:
+            response = self._session.post(
+                'https://api.github.com/graphql', timeout=10,
+                json={'query': _REPO_FILES_QUERY, 'variables': {'name': repo_name}}
+            )
+            if response.status_code != 200:
+                return None
+            payload = _response_json(response)
+        except Exception as e:
+            logger.warning(f"GraphQL listing failed for {repo_name}, using REST: {e}")
+            return None
+        repository = (payload.get('data') or {}).get('repository')
+        if payload.get('errors') or repository is None:
+            return None
+
+        def blobs(tree):
+            # A missing thumbnails folder or an empty repo comes back as null
+            entries = (tree or {}).get('entries') or []
+            return [(entry['name'], (entry.get('object') or {}).get('byteSize', 0))
+                    for entry in entries if entry['type'] == 'blob']
+
+        # Same shape as the /contents entries the table is built from
+        thumbnails = [{'name': name, 'size': size, 'type': 'file'} for name, size in blobs(repository['thumbs'])]
+        return thumbnails, dict(blobs(repository['root']))
+
+    def _fetch_file_commit_dates(self, repo_name, filenames):
+        """Return a map of filename to the display date of its latest commit"""
+        commits_url = f'https://api.github.com/repos/lifetime-memories/{repo_name}/commits'
+
+        def latest_commit_date(filename):
+            # The commit list has no per-file data, so ask for each path's newest commit.
+            # Not ETag-cached: one URL per image would crowd everything else out,
+            # so every open spends one API call per file here
+            try:
+                response = self._make_github_request(f"{commits_url}?path=thumbnails/{quote(filename)}&per_page=1", cache=False)
+                if response.status_code != 200:
+                    return None
+                commits = _response_json(response)
+                if commits:
+                    return _format_github_date(commits[0]['commit']['committer']['date'])
+            except (requests.RequestException, ValueError, KeyError, IndexError) as e:
+                # The date column is optional; this row falls back to the repo's push date
+                logger.warning(f"Failed to fetch the latest commit for {filename}: {e}")
+            return None
+
+        file_commits = {}
+        if not filenames:
+            return file_commits
+        max_workers = min(GITHUB_MAX_CONCURRENCY, len(filenames))
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for filename, date_str in zip(filenames, executor.map(latest_commit_date, filenames)):
+                if date_str:
+                    file_commits[filename] = date_str
+        return file_commits
+
+    def _get_repo_pushed_at(self, repo_name):
+        """Return the repository's last push time from the cached repository list"""
+        for repo in self.repositories:
+            if repo.get('name') == repo_name and repo.get('pushed_at'):
+                return _format_github_date(repo['pushed_at'])
+        return "-"
+
+    def _on_show_file_dates_toggled(self, checked):
+        """Reload the table so the date column reflects the toggle"""
+        if self._current_repo_name:
+            self.load_and_display_images(self._current_repo_name)
+
     def _handle_empty_repository(self):
         """Handle case when repository is empty"""
-        self.image_table.setRowCount(1)
-        self.image_table.setItem(0, 0, QTableWidgetItem("No images uploaded yet."))
-        self.image_table.setItem(0, 1, QTableWidgetItem(""))
-        self.image_table.setItem(0, 2, QTableWidgetItem(""))
-        self.image_table.setItem(0, 4, QTableWidgetItem(""))
+        self.image_rows.set_rows([("No images uploaded yet.", "", "", "", "")])
         self.image_table.resizeColumnsToContents()
         self.set_interactive(True)
         self.web_gallery.setVisible(True)
@@ -1470,7 +2373,6 @@ class MainWindow(QMainWindow):
         self.splitter.setStretchFactor(2, 4)
         self.upload_progress.setValue(100)
         self.upload_progress.setFormat('Ready')
-        QApplication.processEvents()
 
     def _handle_error(self, error_msg):
         """Handle error cases"""
@@ -1482,834 +2384,14 @@ class MainWindow(QMainWindow):
         self.splitter.setStretchFactor(2, 4)
         self.upload_progress.setValue(0)
         self.upload_progress.setFormat('Error loading images')
-        QApplication.processEvents()
-
-    def _generate_gallery_html(self, image_pairs):
-        html = '''
-        <!DOCTYPE html>
-        <html><head><meta charset="utf-8">
-        <meta name="viewport" content="width=device-width, initial-scale=1.0, maximum-scale=1.0, user-scalable=no">
-        <title>Image Gallery</title>
-        <style>
-        html, body { 
-            background: #222; 
-            color: #eee; 
-            margin: 0; 
-            padding: 0;
-            font-family: sans-serif;
-            min-height: 100vh;
-            width: 100%;
-            overflow-x: hidden;
-            box-sizing: border-box;
-        }
-        *, *:before, *:after {
-            box-sizing: inherit;
-        }
-        .gallery-header {
-            padding: 20px;
-            text-align: center;
-            background: rgba(0,0,0,0.4);
-            backdrop-filter: blur(10px);
-            position: sticky;
-            top: 0;
-            z-index: 100;
-            width: 100%;
-            box-sizing: border-box;
-        }
-        .gallery-title {
-            margin: 0;
-            font-size: 24px;
-            color: #fff;
-            word-wrap: break-word;
-            max-width: 100%;
-        }
-        @media (max-width: 600px) {
-            .gallery-header {
-                padding: 20px 16px;
-                min-height: 70px;
-            }
-            .gallery-title {
-                font-size: 22px;
-            }
-        }
-        .gallery-info {
-            margin-top: 10px;
-            font-size: 14px;
-            color: #aaa;
-        }
-        .gallery-view {
-            position: relative;
-            min-height: 100vh;
-            width: 100%;
-            max-width: 100vw;
-            overflow-x: hidden;
-            overflow-y: auto;
-            -webkit-overflow-scrolling: touch;
-            margin: 0;
-            padding: 0;
-        }
-        .image-view {
-            position: fixed;
-            top: 0;
-            left: 0;
-            right: 0;
-            bottom: 0;
-            width: 100%;
-            height: 100%;
-            display: none;
-            background: #222;
-            flex-direction: column;
-            z-index: 1000;
-            touch-action: manipulation;
-            overflow: hidden;
-        }
-        .image-view.mobile {
-            background: rgba(0, 0, 0, 0.95);
-        }
-        .image-view.mobile .controls-container {
-            display: none !important;
-        }
-        .context-menu {
-            display: none;
-            position: fixed;
-            background: rgba(40, 40, 40, 0.98);
-            backdrop-filter: blur(10px);
-            border-radius: 12px;
-            padding: 8px 0;
-            box-shadow: 0 4px 15px rgba(0,0,0,0.3);
-            z-index: 2000;
-        }
-        .context-menu-item {
-            padding: 12px 24px;
-            color: white;
-            font-size: 16px;
-            cursor: pointer;
-            white-space: nowrap;
-        }
-        .context-menu-item:active {
-            background: rgba(255,255,255,0.1);
-        }
-        .gallery-container {
-            width: 100%;
-            max-width: 100vw;
-            margin: 0 auto;
-            padding: 0 24px;
-            box-sizing: border-box;
-            overflow: hidden;
-        }
-        .masonry { 
-            column-count: 10; 
-            column-gap: 8px; 
-            padding: 24px 0;
-            width: 100%;
-            margin: 0 auto;
-            box-sizing: border-box;
-        }
-        .masonry img { 
-            width: 100%; 
-            margin-bottom: 8px; 
-            border-radius: 4px;
-            box-shadow: none;
-            display: block; 
-            break-inside: avoid; 
-            background: #222; 
-            cursor: pointer;
-            transition: transform 0.15s ease-out;
-            height: auto;
-            vertical-align: middle;
-            max-width: 100%;
-        }
-        .masonry img:hover {
-            transform: scale(1.02);
-        }
-        /* Default desktop layout */
-        .masonry { 
-            column-count: 10;
-            column-gap: 8px;
-            padding: 24px 0;
-        }
-
-        /* Mobile-specific detection */
-        @media only screen 
-        and (max-device-width: 812px)
-        and (-webkit-min-device-pixel-ratio: 2),
-        only screen and (max-device-width: 812px)
-        and (min-resolution: 192dpi) { 
-            .gallery-header {
-                padding: 48px 24px;
-                background: rgba(0,0,0,0.85);
-                backdrop-filter: blur(15px);
-                display: flex;
-                flex-direction: column;
-                align-items: center;
-                justify-content: center;
-                height: auto;
-                width: 100vw;
-                margin: 0;
-                box-sizing: border-box;
-                box-shadow: 0 2px 20px rgba(0,0,0,0.4);
-            }
-            .gallery-title {
-                font-size: 24px;
-                line-height: 1.3;
-                padding: 0;
-                margin: 0;
-                width: 100%;
-                text-align: center;
-                font-weight: 600;
-                text-shadow: 0 2px 4px rgba(0,0,0,0.3);
-            }
-            .gallery-info {
-                font-size: 20px;
-                margin-top: 24px;
-                opacity: 0.95;
-                width: 100%;
-                text-align: center;
-            }
-            .gallery-container {
-                padding: 15px;
-                width: 100vw;
-                max-width: 100%;
-                margin: 0 auto;
-                box-sizing: border-box;
-                background: #222;
-                display: flex;
-                justify-content: center;
-            }
-            .masonry { 
-                column-count: 2 !important;
-                column-gap: 15px;
-                padding: 0;
-                margin: 0;
-                width: 100%;
-                max-width: 800px;
-            }
-            .masonry img {
-                border-radius: 12px;
-                margin-bottom: 15px;
-                box-shadow: none;
-                transition: none;
-                position: relative;
-                -webkit-tap-highlight-color: transparent;
-            }
-            /* Remove any hover/active effects on mobile */
-            .masonry img:active,
-            .masonry img:hover {
-                transform: none;
-                box-shadow: none;
-            }
-        }
-            .masonry img:active {
-                transform: scale(0.98);
-            }
-            /* Improve touch targets */
-            button {
-                padding: 16px 24px;
-                border-radius: 14px;
-                font-size: 17px;
-                margin: 10px 0;
-                min-height: 54px;
-                box-shadow: 0 2px 8px rgba(0,0,0,0.2);
-            }
-            /* Add more breathing room at the bottom */
-            .gallery-view {
-                padding-bottom: 32px;
-            }
-        }
-
-        /* Tablet-specific detection */
-        @media only screen 
-        and (min-device-width: 813px) 
-        and (max-device-width: 1366px)
-        and (-webkit-min-device-pixel-ratio: 1.5) {
-            .masonry { 
-                column-count: 3 !important;
-                column-gap: 8px;
-            }
-            .gallery-container {
-                padding: 0 12px;
-            }
-        }
-
-        /* Desktop and general responsive breakpoints */
-        @media screen and (max-width: 576px) {
-            .masonry { 
-                column-count: 2;
-                column-gap: 6px;
-                padding: 12px 0;
-            }
-            .gallery-container {
-                padding: 0 8px;
-            }
-        }
-        @media screen and (min-width: 577px) and (max-width: 768px) {
-            .masonry { 
-                column-count: 3;
-                column-gap: 6px;
-            }
-            .gallery-container {
-                padding: 0 12px;
-            }
-        }
-        @media screen and (min-width: 769px) and (max-width: 992px) {
-            .masonry { column-count: 4; }
-            .gallery-container { padding: 0 16px; }
-        }
-        @media screen and (min-width: 993px) and (max-width: 1200px) {
-            .masonry { column-count: 5; }
-            .gallery-container { padding: 0 20px; }
-        }
-        @media screen and (min-width: 1201px) and (max-width: 1600px) {
-            .masonry { column-count: 6; }
-        }
-        @media screen and (min-width: 1601px) and (max-width: 1920px) {
-            .masonry { column-count: 8; }
-        }
-        @media screen and (min-width: 1921px) {
-            .masonry { column-count: 10; }
-        }
 
-        /* Touch device optimizations */
-        @media (hover: none) and (pointer: coarse) {
-            .gallery-header {
-                padding: 48px 24px;
-                font-size: 42px;
-            }
-            .gallery-container {
-                padding: 15px;
-                margin: 0 auto;
-                display: flex;
-                justify-content: center;
-            }
-            .masonry {
-                column-count: 2 !important;
-                column-gap: 15px;
-                max-width: 800px;
-            }
-            .masonry img {
-                margin-bottom: 15px;
-                border-radius: 12px;
-                -webkit-tap-highlight-color: transparent;
-            }
-            /* Hide desktop controls on mobile */
-            .controls-container {
-                display: none !important;
-            }
-            /* Only force 2 columns if it's also a small screen */
-            @media (max-width: 576px) {
-                .masonry {
-                    column-count: 2 !important;
-                }
-            }
-        }
-
-        /* Custom scrollbar styles */
-        ::-webkit-scrollbar {
-            width: 12px;
-            background: #333;
-        }
-        ::-webkit-scrollbar-thumb {
-            background: #666;
-            border-radius: 6px;
-            border: 2px solid #333;
-        }
-        ::-webkit-scrollbar-thumb:hover {
-            background: #888;
-        }
-
-        /* Image viewer styles */
-        .viewer-header {
-            padding: 16px;
-            display: flex;
-            justify-content: space-between;
-            align-items: center;
-            background: rgba(0,0,0,0.4);
-            backdrop-filter: blur(10px);
-            flex-wrap: wrap;
-            gap: 8px;
-        }
-        .viewer-title {
-            font-size: 1.2rem;
-            margin: 0;
-            word-break: break-all;
-        }
-        .viewer-buttons {
-            display: flex;
-            gap: 8px;
-            flex-wrap: wrap;
-        }
-        .viewer-buttons button {
-            padding: 8px 16px;
-            font-size: 1rem;
-            border-radius: 4px;
-            border: none;
-            background: #444;
-            color: #fff;
-            cursor: pointer;
-            text-decoration: none;
-            white-space: nowrap;
-            min-width: 44px;
-            min-height: 44px;
-            touch-action: manipulation;
-        }
-        .viewer-buttons button:hover {
-            background: #666;
-        }
-        @media (max-width: 600px) {
-            .viewer-header {
-                padding: 12px;
-            }
-            .viewer-title {
-                font-size: 1rem;
-                width: 100%;
-            }
-            .viewer-buttons {
-                width: 100%;
-                justify-content: center;
-            }
-            .viewer-buttons button {
-                padding: 8px 12px;
-                font-size: 0.9rem;
-            }
-        }
-        .viewer-content {
-            flex: 1;
-            overflow: auto;
-            display: flex;
-            align-items: center;
-            justify-content: center;
-            padding: 20px;
-            -webkit-overflow-scrolling: touch;
-            background: rgba(0, 0, 0, 0.9);
-        }
-        .viewer-img {
-            max-width: 100%;
-            max-height: calc(100vh - 120px);
-            border-radius: 4px;
-            box-shadow: none;
-            transition: transform 0.2s ease-out;
-            touch-action: manipulation;
-            background: #222;
-            object-fit: contain;
-        }
-        /* Mobile image viewer styles */
-        @media (hover: none) and (pointer: coarse) {
-            .viewer-content {
-                padding: 0;
-                overflow: hidden;
-                position: relative;
-                width: 100%;
-                height: 100%;
-                display: flex;
-                align-items: center;
-                justify-content: center;
-            }
-            .viewer-img {
-                max-height: 100vh;
-                border-radius: 0;
-                object-fit: contain;
-                transform-origin: center center;
-                position: relative;
-                flex-shrink: 0;
-                transition: none;
-            }
-            .image-view.mobile {
-                background: black;
-            }
-            .image-view.mobile .viewer-content {
-                background: black;
-            }
-        }
-        @media (max-width: 600px) {
-            .viewer-content {
-                padding: 12px 24px;  /* Added horizontal padding */
-            }
-            .viewer-img {
-                max-height: calc(100vh - 150px);
-            }
-        }
-        @media (max-width: 400px) {
-            .viewer-content {
-                padding: 8px 16px;  /* Reduced padding for very small screens */
-            }
-        }
-        </style>
-        </head>
-        <body>
-        <div class="gallery-header">
-            <h1 class="gallery-title">''' + (self._current_repo_name or 'Image Gallery') + '''</h1>
-        </div>
-        <div class="gallery-view">
-            <div class="gallery-container">
-            <div class="masonry">
-        '''
-        for thumb_url, orig_url in image_pairs:
-            filename = orig_url.split('/')[-1]
-            html += f'<img src="{thumb_url}" data-orig-url="{orig_url}" data-filename="{filename}" loading="lazy" onclick="showImage(\'{orig_url}\', \'{filename}\')">\n'
-        html += '''
-            </div>
-        </div>
-        </div>
-        
-        <div class="image-view" onclick="if(event.target === this) hideImage()">
-            <div class="viewer-header controls-container">
-                <h2 class="viewer-title"></h2>
-                <div class="viewer-buttons">
-                    <button onclick="event.stopPropagation(); downloadImage()">Download</button>
-                    <button onclick="event.stopPropagation(); zoomIn()">Zoom In</button>
-                    <button onclick="event.stopPropagation(); zoomOut()">Zoom Out</button>
-                    <button onclick="event.stopPropagation(); hideImage()">Close</button>
-                    <button onclick="openInNewTab()">Open in New Tab</button>
-                    <button onclick="backToGallery()">Back to Gallery</button>
-                </div>
-            </div>
-            <div class="viewer-content">
-                <img id="viewerImg" class="viewer-img" src="" />
-            </div>
-        </div>
-        
-        <script>
-            const isMobile = /iPhone|iPad|iPod|Android/i.test(navigator.userAgent);
-            let longPressTimer = null;
-            let currentOrigUrl = null;
-            let currentFilename = null;
-            let currentScale = 1;
-            let currentTranslateX = 0;
-            let currentTranslateY = 0;
-            let galleryView = document.querySelector('.gallery-view');
-            let imageView = document.querySelector('.image-view');
-            let viewerImg = document.getElementById('viewerImg');
-            let viewerTitle = document.querySelector('.viewer-title');
-            
-            // Touch gesture variables for pinch-to-zoom
-            let initialDistance = 0;
-            let initialScale = 1;
-            let initialTranslateX = 0;
-            let initialTranslateY = 0;
-            let isPinching = false;
-            let lastTouchTime = 0;
-            let touchStartX = 0;
-            let touchStartY = 0;
-            let lastTouchX = 0;
-            let lastTouchY = 0;
-            let isPanning = false;
-            
-            function updateImageTransform() {
-                viewerImg.style.transform = `translate(${currentTranslateX}px, ${currentTranslateY}px) scale(${currentScale})`;
-            }
-            
-            function constrainPan() {
-                const rect = viewerImg.getBoundingClientRect();
-                const containerRect = document.querySelector('.viewer-content').getBoundingClientRect();
-                
-                // Calculate the scaled dimensions
-                const scaledWidth = rect.width * currentScale;
-                const scaledHeight = rect.height * currentScale;
-                
-                // Calculate maximum pan limits
-                const maxPanX = Math.max(0, (scaledWidth - containerRect.width) / 2);
-                const maxPanY = Math.max(0, (scaledHeight - containerRect.height) / 2);
-                
-                // Constrain panning
-                currentTranslateX = Math.max(-maxPanX, Math.min(maxPanX, currentTranslateX));
-                currentTranslateY = Math.max(-maxPanY, Math.min(maxPanY, currentTranslateY));
-            }
-            
-            function showImage(origUrl, filename) {
-                currentOrigUrl = origUrl;
-                currentFilename = filename;
-                currentScale = 1;
-                currentTranslateX = 0;
-                currentTranslateY = 0;
-                
-                viewerImg.src = origUrl;
-                viewerTitle.textContent = filename;
-                imageView.style.display = 'flex';
-                
-                // Add to browser history for both mobile and desktop
-                history.pushState({view: 'image', origUrl: origUrl, filename: filename}, filename, '#image');
-                
-                if (isMobile) {
-                    imageView.classList.add('mobile');
-                    document.querySelector('.controls-container').style.display = 'none';
-                    // Reset transform for mobile
-                    updateImageTransform();
-                } else {
-                    imageView.classList.remove('mobile');
-                    document.querySelector('.controls-container').style.display = 'flex';
-                    galleryView.style.display = 'none';
-                }
-            }
-            
-            function hideImage() {
-                imageView.style.display = 'none';
-                currentOrigUrl = null;
-                currentFilename = null;
-                currentScale = 1;
-                currentTranslateX = 0;
-                currentTranslateY = 0;
-                updateImageTransform();
-            }
-            
-            function zoomIn() {
-                const oldScale = currentScale;
-                currentScale = Math.min(currentScale * 1.2, 3);
-                
-                // Adjust translation to zoom towards center
-                const scaleRatio = currentScale / oldScale;
-                currentTranslateX *= scaleRatio;
-                currentTranslateY *= scaleRatio;
-                
-                constrainPan();
-                updateImageTransform();
-            }
-            
-            function zoomOut() {
-                const oldScale = currentScale;
-                currentScale = Math.max(currentScale / 1.2, 0.5);
-                
-                // Adjust translation to zoom towards center
-                const scaleRatio = currentScale / oldScale;
-                currentTranslateX *= scaleRatio;
-                currentTranslateY *= scaleRatio;
-                
-                constrainPan();
-                updateImageTransform();
-            }
-
-            function downloadImage() {
-                if (currentOrigUrl && currentFilename) {
-                    // Call the Python backend to handle download
-                    if (window.backend) {
-                        window.backend.downloadImage(currentOrigUrl, currentFilename);
-                    }
-                }
-            }
-
-            function backToGallery() {
-                imageView.style.display = 'none';
-                galleryView.style.display = 'block';
-                viewerImg.src = '';
-                currentOrigUrl = null;
-                currentFilename = null;
-                currentScale = 1;
-                currentTranslateX = 0;
-                currentTranslateY = 0;
-                updateImageTransform();
-                
-                // Update browser history to go back to gallery
-                if (history.state && history.state.view === 'image') {
-                    history.back();
-                }
-            }
-
-            function openInNewTab() {
-                if (currentOrigUrl) {
-                    window.open(currentOrigUrl, '_blank');
-                }
-            }
-
-            // Calculate distance between two touch points
-            function getDistance(touch1, touch2) {
-                const dx = touch1.clientX - touch2.clientX;
-                const dy = touch1.clientY - touch2.clientY;
-                return Math.sqrt(dx * dx + dy * dy);
-            }
-
-            // Calculate center point between two touches
-            function getTouchCenter(touch1, touch2) {
-                return {
-                    x: (touch1.clientX + touch2.clientX) / 2,
-                    y: (touch1.clientY + touch2.clientY) / 2
-                };
-            }
-
-            // Touch event handlers for pinch-to-zoom and pan
-            function handleTouchStart(e) {
-                if (e.touches.length === 2) {
-                    // Two finger touch - start pinch gesture
-                    isPinching = true;
-                    isPanning = false;
-                    initialDistance = getDistance(e.touches[0], e.touches[1]);
-                    initialScale = currentScale;
-                    initialTranslateX = currentTranslateX;
-                    initialTranslateY = currentTranslateY;
-                    
-                    const center = getTouchCenter(e.touches[0], e.touches[1]);
-                    const rect = viewerImg.getBoundingClientRect();
-                    const containerRect = document.querySelector('.viewer-content').getBoundingClientRect();
-                    
-                    // Calculate touch point relative to image center
-                    touchStartX = center.x - (rect.left + rect.width / 2);
-                    touchStartY = center.y - (rect.top + rect.height / 2);
-                    
-                    e.preventDefault();
-                } else if (e.touches.length === 1) {
-                    // Single touch - start panning or double tap
-                    isPanning = true;
-                    isPinching = false;
-                    lastTouchX = e.touches[0].clientX;
-                    lastTouchY = e.touches[0].clientY;
-                    
-                    const now = Date.now();
-                    if (now - lastTouchTime < 300) {
-                        // Double tap detected
-                        if (currentScale > 1) {
-                            // Reset zoom
-                            currentScale = 1;
-                            currentTranslateX = 0;
-                            currentTranslateY = 0;
-                        } else {
-                            // Zoom in to double tap point
-                            const rect = viewerImg.getBoundingClientRect();
-                            const containerRect = document.querySelector('.viewer-content').getBoundingClientRect();
-                            
-                            // Calculate zoom center relative to image
-                            const zoomCenterX = e.touches[0].clientX - (rect.left + rect.width / 2);
-                            const zoomCenterY = e.touches[0].clientY - (rect.top + rect.height / 2);
-                            
-                            // Zoom in
-                            currentScale = 2;
-                            
-                            // Adjust translation to zoom towards touch point
-                            currentTranslateX = -zoomCenterX * (currentScale - 1);
-                            currentTranslateY = -zoomCenterY * (currentScale - 1);
-                            
-                            constrainPan();
-                        }
-                        updateImageTransform();
-                        e.preventDefault();
-                    }
-                    lastTouchTime = now;
-                }
-            }
-
-            function handleTouchMove(e) {
-                if (isPinching && e.touches.length === 2) {
-                    // Continue pinch gesture
-                    const currentDistance = getDistance(e.touches[0], e.touches[1]);
-                    const scale = currentDistance / initialDistance;
-                    const newScale = Math.max(0.5, Math.min(3, initialScale * scale));
-                    
-                    // Calculate zoom center
-                    const center = getTouchCenter(e.touches[0], e.touches[1]);
-                    const rect = viewerImg.getBoundingClientRect();
-                    const containerRect = document.querySelector('.viewer-content').getBoundingClientRect();
-                    
-                    // Calculate touch point relative to image center
-                    const touchX = center.x - (rect.left + rect.width / 2);
-                    const touchY = center.y - (rect.top + rect.height / 2);
-                    
-                    // Calculate scale change
-                    const scaleChange = newScale / currentScale;
-                    
-                    // Adjust translation to zoom towards touch point
-                    currentTranslateX = touchX - (touchX - currentTranslateX) * scaleChange;
-                    currentTranslateY = touchY - (touchY - currentTranslateY) * scaleChange;
-                    
-                    currentScale = newScale;
-                    constrainPan();
-                    updateImageTransform();
-                    
-                    e.preventDefault();
-                } else if (isPanning && e.touches.length === 1 && currentScale > 1) {
-                    // Pan the image
-                    const deltaX = e.touches[0].clientX - lastTouchX;
-                    const deltaY = e.touches[0].clientY - lastTouchY;
-                    
-                    currentTranslateX += deltaX;
-                    currentTranslateY += deltaY;
-                    
-                    constrainPan();
-                    updateImageTransform();
-                    
-                    lastTouchX = e.touches[0].clientX;
-                    lastTouchY = e.touches[0].clientY;
-                    
-                    e.preventDefault();
-                }
-            }
-
-            function handleTouchEnd(e) {
-                if (isPinching) {
-                    // End pinch gesture
-                    isPinching = false;
-                    initialDistance = 0;
-                    initialScale = 1;
-                }
-                if (isPanning) {
-                    // End panning
-                    isPanning = false;
-                }
-            }
-
-            // Handle browser back button for both mobile and desktop
-            window.addEventListener('popstate', function(e) {
-                if (imageView.style.display === 'flex') {
-                    hideImage();
-                    // Show gallery view on desktop
-                    if (!isMobile) {
-                        galleryView.style.display = 'block';
-                    }
-                }
-            });
-
-            // Set up mobile-specific handlers
-            if (isMobile) {
-                document.addEventListener('DOMContentLoaded', function() {
-                    const images = document.querySelectorAll('.masonry img');
-                    
-                    images.forEach(img => {
-                        // Handle long press for download
-                        img.addEventListener('touchstart', function(e) {
-                            const origUrl = this.getAttribute('data-orig-url');
-                            const filename = this.getAttribute('data-filename');
-                            
-                            longPressTimer = setTimeout(() => {
-                                e.preventDefault();
-                                if (window.backend) {
-                                    window.backend.downloadImage(origUrl, filename);
-                                }
-                            }, 800);
-                        });
-
-                        img.addEventListener('touchend', function() {
-                            if (longPressTimer) {
-                                clearTimeout(longPressTimer);
-                            }
-                        });
-
-                        img.addEventListener('touchmove', function() {
-                            if (longPressTimer) {
-                                clearTimeout(longPressTimer);
-                            }
-                        });
-                    });
-
-                    // Add touch event listeners to the image viewer for pinch-to-zoom and pan
-                    viewerImg.addEventListener('touchstart', handleTouchStart, { passive: false });
-                    viewerImg.addEventListener('touchmove', handleTouchMove, { passive: false });
-                    viewerImg.addEventListener('touchend', handleTouchEnd, { passive: false });
-                });
-            }
-
-            document.addEventListener('keydown', function(e) {
-                if (imageView.style.display === 'flex') {
-                    if (e.key === 'Escape') hideImage();
-                    if (e.key === '+') zoomIn();
-                    if (e.key === '-') zoomOut();
-                }
-            });
-        </script>
-        </body></html>
-        '''
-        # Store the generated HTML
-        self._current_gallery_html = html
-        return html
+    def _generate_gallery_html(self, images):
+        # Keep only the image list; the page is rendered when it is saved or published
+        self._gallery_images = images
 
     def save_gallery_as_html(self):
         """Save the current gallery view as a standalone HTML file"""
-        if not self._current_gallery_html or not self._current_repo_name:
+        if not self._gallery_images or not self._current_repo_name:
             QMessageBox.warning(self, "Warning", "No gallery is currently loaded.")
             return
             
@@ -2326,26 +2408,38 @@ class MainWindow(QMainWindow):
             )
             
             if file_path:
-                with open(file_path, 'w', encoding='utf-8') as f:
-                    f.write(self._current_gallery_html)
-                QMessageBox.information(self, "Success", "Gallery saved successfully!")
-                
-                # Ask if user wants to open the saved file
-                reply = QMessageBox.question(
-                    self,
-                    "Open File",
-                    "Would you like to open the saved gallery in your default browser?",
-                    QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
-                )
-                
-                if reply == QMessageBox.StandardButton.Yes:
-                    import webbrowser
-                    webbrowser.open(file_path)
+                # Write on a pool thread so a slow disk doesn't stall the UI
+                self.upload_progress.setFormat('Saving gallery...')
+                job = _GallerySaveJob(file_path, self._current_repo_name, self._gallery_images)
+                job.signals.saved.connect(self._on_gallery_saved)
+                job.signals.error.connect(self._on_gallery_save_error)
+                self._gallery_save_job = job  # keeps the signals object alive until delivery
+                QThreadPool.globalInstance().start(job)
                     
         except Exception as e:
             logger.exception("Error saving gallery HTML")
             QMessageBox.critical(self, "Error", f"Failed to save gallery: {str(e)}")
 
+    def _on_gallery_saved(self, file_path):
+        self.upload_progress.setFormat('Ready')
+        QMessageBox.information(self, "Success", "Gallery saved successfully!")
+        
+        # Ask if user wants to open the saved file
+        reply = QMessageBox.question(
+            self,
+            "Open File",
+            "Would you like to open the saved gallery in your default browser?",
+            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
+        )
+        
+        if reply == QMessageBox.StandardButton.Yes:
+            import webbrowser
+            webbrowser.open(file_path)
+
+    def _on_gallery_save_error(self, message):
+        self.upload_progress.setFormat('Ready')
+        QMessageBox.critical(self, "Error", f"Failed to save gallery: {message}")
+
     def handle_repo_double_click(self, item):
         """Handle double-click on repository list item"""
         if item:
@@ -2360,118 +2454,400 @@ class MainWindow(QMainWindow):
                     # Restore cursor
                     QApplication.restoreOverrideCursor()
 
+# Pages build polling backs off from the initial to the max delay (seconds)
+BUILD_POLL_INITIAL_DELAY = 2
+BUILD_POLL_MAX_DELAY = 60
+
 class GitHubPagesBuildTracker(QObject):
     build_status_updated = pyqtSignal(str, str)  # status, message
     build_completed = pyqtSignal(bool, str)  # success, url
     finished = pyqtSignal()
 
-    def __init__(self, repo_name):
+    def __init__(self, repo_name, headers):
         super().__init__()
         self.repo_name = repo_name
         self._is_cancelled = False
-        self.max_attempts = 60  # 5 minutes with 5-second intervals
+        # Every poll hits the same host; keep one connection alive across them
+        self._session = _new_session(pool_maxsize=1)
+        self._session.headers.update(headers)
+        self.max_wait = 300  # give up after 5 minutes
         self.attempt_count = 0
+        self._deadline = None
+        self._delay = BUILD_POLL_INITIAL_DELAY
+        self._last_status = None
+        self._last_etag = None
+        self._timer = None
 
     def cancel(self):
+        # Checked when the next poll fires; quitting the thread drops the timer
         self._is_cancelled = True
 
     def run(self):
-        """Monitor GitHub Pages build status"""
+        """Start monitoring GitHub Pages build status; polls are driven by a timer"""
+        # Runs on the tracker thread, so the timer fires on its event loop
+        # and the thread sits idle between polls instead of sleeping
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.timeout.connect(self._check_once)
+        # Wait a bit for the build to start
+        self._deadline = time.monotonic() + 3 + self.max_wait
+        self._timer.start(3000)
+
+    def close(self):
+        """Release the polling session - called once the tracker thread has stopped"""
+        self._session.close()
+
+    def _finish(self):
+        self.close()
+        self.finished.emit()
+
+    def _schedule_next(self):
+        self.attempt_count += 1
+        # Back off while the status stays the same; jitter keeps checks from
+        # lining up with other clients
+        self._timer.start(int(self._delay * random.uniform(0.8, 1.2) * 1000))
+        self._delay = min(self._delay * 2, BUILD_POLL_MAX_DELAY)
+
+    def _check_once(self):
+        """Make one status request and either finish or schedule the next"""
+        if self._is_cancelled:
+            self._finish()
+            return
+        if time.monotonic() >= self._deadline:
+            # Ran out of time without a final status
+            self.build_status_updated.emit('timeout', 'Build status check timed out. Please check manually.')
+            self.build_completed.emit(False, '')
+            self._finish()
+            return
         try:
-            headers = {
-                'Authorization': f"token {os.getenv('GITHUB_TOKEN')}",
-                'Accept': 'application/vnd.github.v3+json'
-            }
+            # Check GitHub Pages status
+            pages_url = f'https://api.github.com/repos/lifetime-memories/{self.repo_name}/pages'
+            headers = {}
+            if self._last_etag:
+                # A 304 costs no rate limit quota and carries no body
+                headers['If-None-Match'] = self._last_etag
+            response = self._session.get(pages_url, headers=headers, timeout=10)
             
-            # Wait a bit for the build to start
-            import time
-            time.sleep(3)
-            
-            while not self._is_cancelled and self.attempt_count < self.max_attempts:
-                try:
-                    # Check GitHub Pages status
-                    pages_url = f'https://api.github.com/repos/lifetime-memories/{self.repo_name}/pages'
-                    response = requests.get(pages_url, headers=headers, timeout=10)
-                    
-                    if response.status_code == 200:
-                        pages_data = response.json()
-                        status = pages_data.get('status', 'unknown')
-                        build_type = pages_data.get('build_type', 'unknown')
-                        
-                        if status == 'built':
-                            # Build completed successfully
-                            site_url = pages_data.get('html_url', f'https://lifetime-memories.github.io/{self.repo_name}')
-                            self.build_status_updated.emit('success', f'Build completed successfully!')
-                            self.build_completed.emit(True, site_url)
-                            break
-                        elif status == 'building':
-                            # Still building
-                            self.build_status_updated.emit('building', f'Building site... (attempt {self.attempt_count + 1}/{self.max_attempts})')
-                        elif status == 'errored':
-                            # Build failed
-                            error_msg = pages_data.get('error', {}).get('message', 'Unknown build error')
-                            self.build_status_updated.emit('error', f'Build failed: {error_msg}')
-                            self.build_completed.emit(False, '')
-                            break
-                        elif status == 'not_built':
-                            # Not built yet
-                            self.build_status_updated.emit('waiting', f'Waiting for build to start... (attempt {self.attempt_count + 1}/{self.max_attempts})')
-                        else:
-                            # Unknown status
-                            self.build_status_updated.emit('unknown', f'Unknown build status: {status}')
-                    
-                    elif response.status_code == 404:
-                        # GitHub Pages not enabled or not found
-                        self.build_status_updated.emit('error', 'GitHub Pages not found or not enabled')
-                        self.build_completed.emit(False, '')
-                        break
-                    else:
-                        # API error
-                        self.build_status_updated.emit('error', f'API error: {response.status_code}')
-                        self.build_completed.emit(False, '')
-                        break
-                        
-                except requests.exceptions.RequestException as e:
-                    self.build_status_updated.emit('error', f'Network error: {str(e)}')
-                    self.build_completed.emit(False, '')
-                    break
+            if response.status_code == 304:
+                # Nothing changed since the last poll
+                pass
+            elif response.status_code == 200:
+                self._last_etag = response.headers.get('ETag')
+                pages_data = response.json()
+                status = pages_data.get('status', 'unknown')
+                if status != self._last_status:
+                    # Poll quickly again right after a transition
+                    self._delay = BUILD_POLL_INITIAL_DELAY
+                    self._last_status = status
                 
-                self.attempt_count += 1
-                time.sleep(5)  # Wait 5 seconds before next check
+                if status == 'built':
+                    # Build completed successfully
+                    site_url = pages_data.get('html_url', f'https://lifetime-memories.github.io/{self.repo_name}')
+                    self.build_status_updated.emit('success', f'Build completed successfully!')
+                    self.build_completed.emit(True, site_url)
+                    self._finish()
+                    return
+                elif status == 'building':
+                    # Still building
+                    self.build_status_updated.emit('building', f'Building site... (check {self.attempt_count + 1})')
+                elif status == 'errored':
+                    # Build failed
+                    error_msg = pages_data.get('error', {}).get('message', 'Unknown build error')
+                    self.build_status_updated.emit('error', f'Build failed: {error_msg}')
+                    self.build_completed.emit(False, '')
+                    self._finish()
+                    return
+                elif status == 'not_built':
+                    # Not built yet
+                    self.build_status_updated.emit('waiting', f'Waiting for build to start... (check {self.attempt_count + 1})')
+                else:
+                    # Unknown status
+                    self.build_status_updated.emit('unknown', f'Unknown build status: {status}')
             
-            # If we've exhausted all attempts
-            if self.attempt_count >= self.max_attempts and not self._is_cancelled:
-                self.build_status_updated.emit('timeout', 'Build status check timed out. Please check manually.')
+            elif response.status_code == 404:
+                # GitHub Pages not enabled or not found
+                self.build_status_updated.emit('error', 'GitHub Pages not found or not enabled')
+                self.build_completed.emit(False, '')
+                self._finish()
+                return
+            else:
+                # API error
+                self.build_status_updated.emit('error', f'API error: {response.status_code}')
                 self.build_completed.emit(False, '')
+                self._finish()
+                return
                 
+        except requests.exceptions.RequestException as e:
+            self.build_status_updated.emit('error', f'Network error: {str(e)}')
+            self.build_completed.emit(False, '')
+            self._finish()
+            return
         except Exception as e:
             logger.exception(f"Error in GitHub Pages build tracker: {e}")
             self.build_status_updated.emit('error', f'Tracker error: {str(e)}')
             self.build_completed.emit(False, '')
+            self._finish()
+            return
+        
+        self._schedule_next()
+
+class PageBuildWebhookServer(QObject):
+    """Receives GitHub page_build webhook deliveries on a background HTTP thread"""
+    page_build = pyqtSignal(str, str, str)  # repo name, build status, error message
+
+    def __init__(self, secret, port, parent=None):
+        super().__init__(parent)
+        self._secret = secret.encode('utf-8')
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                body = self.rfile.read(int(self.headers.get('Content-Length', 0)))
+                if self.path != WEBHOOK_PATH:
+                    self.send_response(404)
+                elif not server._signature_valid(body, self.headers.get('X-Hub-Signature-256', '')):
+                    self.send_response(401)
+                else:
+                    self.send_response(204)
+                    if self.headers.get('X-GitHub-Event') == 'page_build':
+                        server._handle_page_build(body)
+                self.end_headers()
+
+            def log_message(self, format, *args):
+                logger.debug(f"Webhook request: {format % args}")
+
+        self._httpd = ThreadingHTTPServer(('127.0.0.1', port), Handler)
+        self._thread = threading.Thread(target=self._httpd.serve_forever, name='webhook', daemon=True)
+
+    def _signature_valid(self, body, signature):
+        expected = 'sha256=' + hmac.new(self._secret, body, hashlib.sha256).hexdigest()
+        return hmac.compare_digest(expected, signature)
+
+    def _handle_page_build(self, body):
+        try:
+            payload = json.loads(body)
+            build = payload.get('build') or {}
+            error = (build.get('error') or {}).get('message') or ''
+            # Signals cross into the GUI thread as queued connections
+            self.page_build.emit(payload['repository']['name'], build.get('status', ''), error)
+        except Exception as e:
+            logger.error(f"Invalid page_build payload: {e}")
+
+    def start(self):
+        self._thread.start()
+        logger.info(f"Listening for GitHub webhooks on port {self._httpd.server_address[1]}")
+
+    def stop(self):
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+# Write size for saved downloads; large chunks keep write syscalls rare
+DOWNLOAD_CHUNK_SIZE = 1 << 20
+
+class ImageDownloadWorker(QObject):
+    progress = pyqtSignal(int, int)  # bytes written, total bytes (0 if unknown)
+    download_finished = pyqtSignal(str)  # error message, empty on success
+    finished = pyqtSignal()
+
+    def __init__(self, url, file_path, headers):
+        super().__init__()
+        self.url = url
+        self.file_path = file_path
+        self.headers = headers
+
+    def run(self):
+        """Stream the file to disk, reporting progress per chunk"""
+        error = ''
+        try:
+            with _github_get(self.url, headers=self.headers, stream=True, timeout=30) as response:
+                if response.status_code != 200:
+                    error = f"Failed to download image: {response.status_code}"
+                else:
+                    total = int(response.headers.get('Content-Length', 0))
+                    done = 0
+                    with open(self.file_path, 'wb') as f:
+                        for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                            f.write(chunk)
+                            done += len(chunk)
+                            self.progress.emit(done, total)
+        except Exception as e:
+            logger.exception("Error downloading image")
+            error = f"Failed to download image: {str(e)}"
+            # Don't leave a truncated file behind
+            try:
+                os.remove(self.file_path)
+            except OSError:
+                pass
+        finally:
+            self.download_finished.emit(error)
+            self.finished.emit()
+
+class ImageUploadWorker(QObject):
+    progress = pyqtSignal(int)  # files processed so far
+    upload_finished = pyqtSignal(list)  # error messages
+    finished = pyqtSignal()
+
+    def __init__(self, repo_name, files, headers):
+        super().__init__()
+        self.repo_name = repo_name
+        self.files = files
+        self.headers = headers
+        self.api_url = f'https://api.github.com/repos/lifetime-memories/{repo_name}'
+
+    def _create_blob(self, data):
+        """Store bytes, or a file streamed from disk, as a git blob and return its sha"""
+        if isinstance(data, bytes):
+            kwargs = {'json': {'content': ImageService.image_to_base64(data), 'encoding': 'base64'}}
+        else:
+            kwargs = {'data': data, 'headers': {**self.headers, 'Content-Type': 'application/json'}}
+        kwargs.setdefault('headers', self.headers)
+        response = _github_request('POST', f'{self.api_url}/git/blobs', timeout=60, **kwargs)
+        if response.status_code != 201:
+            raise Exception(f"Failed to create blob: {response.status_code}")
+        return response.json()['sha']
+
+    def _upload_one(self, file_path):
+        """Create blobs for one image and its thumbnail - returns (tree entries, error message)"""
+        try:
+            filename = os.path.basename(file_path)
+            # Compress image (max 200x200, JPEG, quality 85) on another thread
+            # while the original uploads, so the two don't run back to back
+            thumb_future = _IMAGE_CPU_EXECUTOR.submit(ImageService.make_upload_thumbnail, file_path)
+            # The original is streamed from disk, never held in memory whole
+            orig_sha = self._create_blob(_BlobUploadBody(file_path))
+            thumb_sha = self._create_blob(thumb_future.result())
+            return [
+                {'path': filename, 'mode': '100644', 'type': 'blob', 'sha': orig_sha},
+                {'path': f'thumbnails/{filename}', 'mode': '100644', 'type': 'blob', 'sha': thumb_sha},
+            ], None
+        except Exception as e:
+            return [], f"Error with {file_path}: {str(e)}"
+
+    def _commit_entries(self, entries):
+        """Add all entries to the default branch in a single commit"""
+        repo_response = _github_request('GET', self.api_url, headers=self.headers, timeout=30)
+        if repo_response.status_code != 200:
+            raise Exception(f"Failed to get repository info: {repo_response.status_code}")
+        ref_url = f"{self.api_url}/git/refs/heads/{repo_response.json()['default_branch']}"
+        ref_response = _github_request('GET', ref_url, headers=self.headers, timeout=30)
+        if ref_response.status_code != 200:
+            raise Exception(f"Failed to get branch info: {ref_response.status_code}")
+        base_sha = ref_response.json()['object']['sha']
+
+        tree_response = _github_request(
+            'POST', f'{self.api_url}/git/trees', headers=self.headers, timeout=60,
+            json={'base_tree': base_sha, 'tree': entries}
+        )
+        if tree_response.status_code != 201:
+            raise Exception(f"Failed to create tree: {tree_response.status_code}")
+
+        image_count = len(entries) // 2
+        commit_response = _github_request(
+            'POST', f'{self.api_url}/git/commits', headers=self.headers, timeout=30,
+            json={
+                'message': f"Upload {image_count} image{'s' if image_count != 1 else ''}",
+                'tree': tree_response.json()['sha'],
+                'parents': [base_sha]
+            }
+        )
+        if commit_response.status_code != 201:
+            raise Exception(f"Failed to create commit: {commit_response.status_code}")
+
+        ref_response = _github_request(
+            'PATCH', ref_url, headers=self.headers, timeout=30,
+            json={'sha': commit_response.json()['sha']}
+        )
+        if ref_response.status_code != 200:
+            raise Exception(f"Failed to update branch: {ref_response.status_code}")
+
+    def run(self):
+        """Upload all files as blobs in parallel, then commit them together"""
+        errors = []
+        entries = []
+        try:
+            max_workers = min(GITHUB_MAX_CONCURRENCY, len(self.files)) if self.files else 1
+            with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = [executor.submit(self._upload_one, file_path) for file_path in self.files]
+                for done, future in enumerate(concurrent.futures.as_completed(futures), 1):
+                    file_entries, error = future.result()
+                    if error:
+                        errors.append(error)
+                    entries.extend(file_entries)
+                    self.progress.emit(done)
+            if entries:
+                self._commit_entries(entries)
+        except Exception as e:
+            logger.exception(f"Error in image upload worker: {e}")
+            errors.append(f"Upload error: {str(e)}")
         finally:
+            self.upload_finished.emit(errors)
             self.finished.emit()
 
+# Read size for streamed blob uploads; a multiple of 3 so each chunk
+# base64-encodes without padding and the pieces concatenate cleanly
+BLOB_READ_CHUNK = 57 * 1024
+
+_b64encode = pybase64.b64encode if pybase64 is not None else base64.b64encode
+
+def _b64_stream(path, chunk=BLOB_READ_CHUNK):
+    """Yield a file's contents as base64, one read chunk at a time"""
+    with open(path, 'rb') as f:
+        while True:
+            data = f.read(chunk)
+            if not data:
+                break
+            yield _b64encode(data)
+
+class _BlobUploadBody:
+    """JSON body for POST /git/blobs that encodes the file while it is sent"""
+
+    def __init__(self, path):
+        self.path = path
+
+    def __iter__(self):
+        # requests sends an iterable of unknown length with chunked encoding;
+        # a fresh pass over the file on each iteration keeps retries working
+        yield b'{"encoding":"base64","content":"'
+        yield from _b64_stream(self.path)
+        yield b'"}'
+
+# Dark palette colours; QColor is a plain value type, safe to build at import
+_GREY_53 = QColor(53, 53, 53)
+_GREY_35 = QColor(35, 35, 35)
+_LIGHT_GREY = QColor(220, 220, 220)
+_ACCENT_BLUE = QColor(42, 130, 218)
+
+@functools.cache
+def _make_dark_palette():
+    """Build the application's dark palette (once, after QApplication exists)"""
+    dark_palette = QPalette()
+    for role, color in (
+        (QPalette.ColorRole.Window, _GREY_53),
+        (QPalette.ColorRole.WindowText, _LIGHT_GREY),
+        (QPalette.ColorRole.Base, _GREY_35),
+        (QPalette.ColorRole.AlternateBase, _GREY_53),
+        (QPalette.ColorRole.ToolTipBase, _LIGHT_GREY),
+        (QPalette.ColorRole.ToolTipText, _LIGHT_GREY),
+        (QPalette.ColorRole.Text, _LIGHT_GREY),
+        (QPalette.ColorRole.Button, _GREY_53),
+        (QPalette.ColorRole.ButtonText, _LIGHT_GREY),
+        (QPalette.ColorRole.BrightText, QColor(255, 0, 0)),
+        (QPalette.ColorRole.Link, _ACCENT_BLUE),
+        (QPalette.ColorRole.Highlight, _ACCENT_BLUE),
+        (QPalette.ColorRole.HighlightedText, _GREY_35),
+    ):
+        dark_palette.setColor(role, color)
+    return dark_palette
+
 def main():
     logger.info("Starting application")
+    _register_gallery_scheme()
     app = QApplication(sys.argv)
     app.setStyle("Fusion")
+    QPixmapCache.setCacheLimit(THUMBNAIL_PIXMAP_CACHE_KB)
 
     # Set up dark palette
-    dark_palette = QPalette()
-    dark_palette.setColor(QPalette.ColorRole.Window, QColor(53, 53, 53))
-    dark_palette.setColor(QPalette.ColorRole.WindowText, QColor(220, 220, 220))
-    dark_palette.setColor(QPalette.ColorRole.Base, QColor(35, 35, 35))
-    dark_palette.setColor(QPalette.ColorRole.AlternateBase, QColor(53, 53, 53))
-    dark_palette.setColor(QPalette.ColorRole.ToolTipBase, QColor(220, 220, 220))
-    dark_palette.setColor(QPalette.ColorRole.ToolTipText, QColor(220, 220, 220))
-    dark_palette.setColor(QPalette.ColorRole.Text, QColor(220, 220, 220))
-    dark_palette.setColor(QPalette.ColorRole.Button, QColor(53, 53, 53))
-    dark_palette.setColor(QPalette.ColorRole.ButtonText, QColor(220, 220, 220))
-    dark_palette.setColor(QPalette.ColorRole.BrightText, QColor(255, 0, 0))
-    dark_palette.setColor(QPalette.ColorRole.Link, QColor(42, 130, 218))
-    dark_palette.setColor(QPalette.ColorRole.Highlight, QColor(42, 130, 218))
-    dark_palette.setColor(QPalette.ColorRole.HighlightedText, QColor(35, 35, 35))
-    app.setPalette(dark_palette)
+    app.setPalette(_make_dark_palette())
 
     window = MainWindow()
     window.showMaximized()
@@ -1,3 +1,4 @@
+import heapq
 from PyQt6.QtWidgets import QLayout
 from PyQt6.QtCore import QRect, QSize, QPoint, Qt
 
@@ -7,10 +8,16 @@ class MasonryLayout(QLayout):
         self.setContentsMargins(margin, margin, margin, margin)
         self.setSpacing(spacing)
         self.itemList = []
+        self._heights = None  # sizeHint height per item, None until read from Qt
         self.columns = columns
+        self._layout_key = None  # inputs of the last placement, to skip repeats
+        self._last_col_width = None  # width last applied to the item widgets
 
     def addItem(self, item):
         self.itemList.append(item)
+        self._heights = None
+        self._layout_key = None
+        self._last_col_width = None
 
     def count(self):
         return len(self.itemList)
@@ -22,9 +29,17 @@ class MasonryLayout(QLayout):
 
     def takeAt(self, index):
         if 0 <= index < len(self.itemList):
+            self._heights = None
+            self._layout_key = None
             return self.itemList.pop(index)
         return None
 
+    def invalidate(self):
+        # Called on every child updateGeometry(); only mark the heights stale
+        # here and read them once in the next doLayout
+        self._heights = None
+        super().invalidate()
+
     def setGeometry(self, rect):
         super().setGeometry(rect)
         self.doLayout(rect)
@@ -43,19 +58,30 @@ class MasonryLayout(QLayout):
     def doLayout(self, rect):
         if not self.itemList:
             return
+        if self._heights is None:
+            self._heights = [item.sizeHint().height() for item in self.itemList]
+        heights = self._heights
         spacing = self.spacing()
         columns = self.columns
+        # Qt repeats setGeometry with the same rect on show/hide and focus changes
+        key = (rect.x(), rect.y(), rect.width(), spacing, columns, tuple(heights))
+        if key == self._layout_key:
+            return
+        left = rect.x()
         col_width = (rect.width() - (columns - 1) * spacing) // columns
-        y_offsets = [rect.y()] * columns
-        for item in self.itemList:
-            w = col_width
-            h = item.sizeHint().height()
-            col = y_offsets.index(min(y_offsets))
-            x = rect.x() + col * (col_width + spacing)
-            y = y_offsets[col]
-            item.widget().setFixedWidth(col_width)
+        if col_width != self._last_col_width:
+            # Resizing a widget invalidates this layout, so only do it when the width moves
+            self._last_col_width = col_width
+            for item in self.itemList:
+                item.widget().setFixedWidth(col_width)
+        # (y offset, column) pairs; the top is the shortest column, lowest index on ties
+        heap = [(rect.y(), col) for col in range(columns)]
+        for item, h in zip(self.itemList, heights):
+            y, col = heapq.heappop(heap)
+            x = left + col * (col_width + spacing)
             item.setGeometry(QRect(QPoint(x, y), QSize(col_width, h)))
-            y_offsets[col] += h + spacing
+            heapq.heappush(heap, (y + h + spacing, col))
+        self._layout_key = key
 
     def expandingDirections(self):
         return Qt.Orientations(Qt.Orientation(0))
\ No newline at end of file
@@ -4,15 +4,28 @@ from PyQt6.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
 from PyQt6.QtCore import Qt, QSize, QThread, pyqtSignal
 from PyQt6.QtGui import QPixmap, QImage, QFont
 import requests
+import concurrent.futures
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import os
 from PIL import Image
 import io
-import base64
 from dotenv import load_dotenv
 import logging
+from services.image_service import ImageService
+from services.github_service import GitHubService
+from utils.cache_manager import thumbnail_cache
 
 logger = logging.getLogger(__name__)
 
+# Shared keep-alive session for thumbnail downloads and listing calls
+_session = requests.Session()
+_session.mount('https://', HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=16,
+    max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[502, 503, 504])
+))
+
 class ImageUploadThread(QThread):
     progress = pyqtSignal(int)
     finished = pyqtSignal()
@@ -26,26 +39,28 @@ class ImageUploadThread(QThread):
     def run(self):
         try:
             logger.info(f"Starting image upload for {len(self.image_paths)} images to {self.repo_name}")
-            headers = {
-                'Authorization': f"token {os.getenv('GITHUB_TOKEN')}",
-                'Accept': 'application/vnd.github.v3+json'
-            }
+            github = GitHubService()
+            # Everything goes into one commit on top of the default branch
+            branch = github.get_repository(self.repo_name)['default_branch']
+            head = github.get_commits(self.repo_name, per_page=1)[0]
+            tree_items = []
 
             for i, image_path in enumerate(self.image_paths):
                 logger.info(f"Processing image {i+1}/{len(self.image_paths)}: {image_path}")
+                # Read the file once; the same bytes feed the base64 encoder and the decoder
+                with open(image_path, 'rb') as f:
+                    raw = f.read()
+                orig_data = ImageService.image_to_base64(raw)
+
                 # Process image
-                with Image.open(image_path) as img:
-                    # Create thumbnail
+                with Image.open(io.BytesIO(raw)) as img:
+                    # Create thumbnail; thumbnail() lets libjpeg decode at reduced size
                     img.thumbnail((200, 200))
                     thumb_buffer = io.BytesIO()
                     img.save(thumb_buffer, format='JPEG', quality=85)
-                    thumb_data = base64.b64encode(thumb_buffer.getvalue()).decode()
-
-                    # Get original image data
-                    with open(image_path, 'rb') as f:
-                        orig_data = base64.b64encode(f.read()).decode()
+                    thumb_data = ImageService.image_to_base64(thumb_buffer.getvalue())
 
-                    # Upload both original and thumbnail
+                    # Upload both original and thumbnail as blobs
                     filename = os.path.basename(image_path)
                     files = [
                         {'path': filename, 'content': orig_data},
@@ -54,21 +69,20 @@ class ImageUploadThread(QThread):
 
                     for file in files:
                         logger.info(f"Uploading {file['path']}")
-                        response = requests.put(
-                            f'https://api.github.com/repos/lifetime-memories/{self.repo_name}/contents/{file["path"]}',
-                            headers=headers,
-                            json={
-                                'message': f'Upload {file["path"]}',
-                                'content': file['content']
-                            }
-                        )
-                        if response.status_code not in [201, 200]:
-                            error_msg = f"Failed to upload {file['path']}. Status code: {response.status_code}"
-                            logger.error(error_msg)
-                            raise Exception(error_msg)
+                        blob_sha = github.create_blob(self.repo_name, file['content'], encoding='base64')
+                        tree_items.append({'path': file['path'], 'mode': '100644', 'type': 'blob', 'sha': blob_sha})
 
                 self.progress.emit(int((i + 1) / len(self.image_paths) * 100))
 
+            tree_sha = github.create_tree(self.repo_name, head['commit']['tree']['sha'], tree_items)
+            commit_sha = github.create_commit(
+                self.repo_name, f'Upload {len(self.image_paths)} images', tree_sha, head['sha']
+            )
+            if not github.create_or_update_branch(self.repo_name, branch, commit_sha):
+                error_msg = f"Failed to update branch {branch}"
+                logger.error(error_msg)
+                raise Exception(error_msg)
+
             logger.info("Image upload completed successfully")
             self.finished.emit()
 
@@ -76,6 +90,45 @@ class ImageUploadThread(QThread):
             logger.exception("Error during image upload")
             self.error.emit(str(e))
 
+class ThumbnailDownloadThread(QThread):
+    image_loaded = pyqtSignal(int, bytes)  # card index, image data
+    image_failed = pyqtSignal(int, str)  # card index, label text
+
+    def __init__(self, thumbnails, max_workers=8, parent=None):
+        super().__init__(parent)
+        self.thumbnails = thumbnails
+        self.max_workers = max_workers
+
+    def _download(self, thumb):
+        """Return (status code, data), from the disk cache when the blob was seen before"""
+        sha = thumb.get('sha')
+        data = thumbnail_cache.get(sha)
+        if data is not None:
+            return 200, data
+        logger.info(f"Loading image: {thumb['name']} from {thumb['download_url']}")
+        response = _session.get(thumb['download_url'], timeout=10)
+        if response.status_code == 200:
+            thumbnail_cache.set(sha, response.content)
+        return response.status_code, response.content
+
+    def run(self):
+        # Downloads overlap on the shared session; results arrive in completion order
+        with concurrent.futures.ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = {executor.submit(self._download, thumb): index for index, thumb in enumerate(self.thumbnails)}
+            for future in concurrent.futures.as_completed(futures):
+                index = futures[future]
+                name = self.thumbnails[index]['name']
+                try:
+                    status_code, data = future.result()
+                    if status_code == 200:
+                        self.image_loaded.emit(index, data)
+                    else:
+                        logger.error(f"Failed to download image {name}. Status code: {status_code}")
+                        self.image_failed.emit(index, "Failed to load image")
+                except Exception:
+                    logger.exception(f"Error loading image {name}")
+                    self.image_failed.emit(index, "Error loading image")
+
 class RepositoryView(QMainWindow):
     def __init__(self, repo_name):
         super().__init__()
@@ -129,6 +182,9 @@ class RepositoryView(QMainWindow):
         scroll.setWidget(self.image_container)
         main_layout.addWidget(scroll)
         
+        self._image_labels = []  # grid card index -> image label
+        self._download_thread = None
+        
         # Progress bar (initially hidden)
         self.progress_bar = QProgressBar()
         self.progress_bar.setVisible(False)
@@ -154,36 +210,10 @@ class RepositoryView(QMainWindow):
         # Remove fixed minimum size, let scaled pixmap determine size hint
         # image_label.setMinimumSize(200, 200)
         image_label.setStyleSheet("background-color: #e0e0e0;")  # Slightly darker gray background
-        
-        try:
-            # Load image from URL
-            logger.info(f"Loading image: {thumb['name']} from {thumb['download_url']}")
-            response = requests.get(thumb['download_url'])
-            if response.status_code == 200:
-                image = QImage.fromData(response.content)
-                if not image.isNull():
-                    pixmap = QPixmap.fromImage(image)
-                    # Scale pixmap to fit within a reasonable size while maintaining aspect ratio
-                    scaled_pixmap = pixmap.scaled(220, 220, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
-                    image_label.setPixmap(scaled_pixmap)
-                    # Adjust the size of the QLabel to fit the scaled pixmap
-                    image_label.setFixedSize(scaled_pixmap.size())
-                    logger.info(f"Successfully loaded image: {thumb['name']}")
-                else:
-                    logger.error(f"Failed to create QImage from data for {thumb['name']}")
-                    image_label.setText("Failed to load image")
-                    # Set a fixed size for failed load case
-                    image_label.setFixedSize(220, 220)
-            else:
-                logger.error(f"Failed to download image {thumb['name']}. Status code: {response.status_code}")
-                image_label.setText("Failed to load image")
-                # Set a fixed size for failed download case
-                image_label.setFixedSize(220, 220)
-        except Exception as e:
-            logger.exception(f"Error loading image {thumb['name']}")
-            image_label.setText("Error loading image")
-            # Set a fixed size for error case
-            image_label.setFixedSize(220, 220)
+        # Placeholder until the download thread delivers the image
+        image_label.setText("Loading...")
+        image_label.setFixedSize(220, 220)
+        self._image_labels.append(image_label)
         
         layout.addWidget(image_label)
         
@@ -214,9 +244,10 @@ class RepositoryView(QMainWindow):
                 self.image_grid.itemAt(i).widget().setParent(None)
             
             # Fetch thumbnails
-            response = requests.get(
+            response = _session.get(
                 f'https://api.github.com/repos/lifetime-memories/{self.repo_name}/contents/thumbnails',
-                headers=headers
+                headers=headers,
+                timeout=10
             )
             
             if response.status_code == 200:
@@ -243,16 +274,54 @@ class RepositoryView(QMainWindow):
         col = 0
         max_cols = 4  # Maximum number of columns in the grid
         
-        for thumb in thumbnails:
-            if thumb['type'] == 'file':
-                logger.info(f"Creating card for image: {thumb['name']}")
-                image_card = self.create_image_card(thumb)
-                self.image_grid.addWidget(image_card, row, col)
-                
-                col += 1
-                if col >= max_cols:
-                    col = 0
-                    row += 1
+        files = [thumb for thumb in thumbnails if thumb['type'] == 'file']
+        self._image_labels = []
+        for thumb in files:
+            logger.info(f"Creating card for image: {thumb['name']}")
+            image_card = self.create_image_card(thumb)
+            self.image_grid.addWidget(image_card, row, col)
+            
+            col += 1
+            if col >= max_cols:
+                col = 0
+                row += 1
+        
+        # Fetch the thumbnails off the UI thread; cards fill in as they arrive.
+        # Parented to the view so a superseded thread can finish on its own;
+        # the slots ignore whatever it still emits
+        self._download_thread = ThumbnailDownloadThread(files, parent=self)
+        self._download_thread.finished.connect(self._on_download_thread_finished)
+        self._download_thread.finished.connect(self._download_thread.deleteLater)
+        self._download_thread.image_loaded.connect(self.on_image_loaded)
+        self._download_thread.image_failed.connect(self.on_image_failed)
+        self._download_thread.start()
+
+    def _on_download_thread_finished(self):
+        # The thread deletes itself; drop the reference unless a newer one replaced it
+        if self.sender() is self._download_thread:
+            self._download_thread = None
+
+    def on_image_loaded(self, index, data):
+        if self.sender() is not self._download_thread:
+            # Index into a grid that has since been rebuilt
+            return
+        image_label = self._image_labels[index]
+        image = QImage.fromData(data)
+        if not image.isNull():
+            pixmap = QPixmap.fromImage(image)
+            # Scale pixmap to fit within a reasonable size while maintaining aspect ratio
+            scaled_pixmap = pixmap.scaled(220, 220, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
+            image_label.setPixmap(scaled_pixmap)
+            # Adjust the size of the QLabel to fit the scaled pixmap
+            image_label.setFixedSize(scaled_pixmap.size())
+        else:
+            logger.error(f"Failed to create QImage from data for card {index}")
+            image_label.setText("Failed to load image")
+
+    def on_image_failed(self, index, message):
+        if self.sender() is not self._download_thread:
+            return
+        self._image_labels[index].setText(message)
 
     def upload_images(self):
         logger.info("Opening file dialog for image upload")
@@ -0,0 +1,394 @@
+const isMobile = /iPhone|iPad|iPod|Android/i.test(navigator.userAgent);
+let longPressTimer = null;
+let currentOrigUrl = null;
+let currentFilename = null;
+let currentScale = 1;
+let currentTranslateX = 0;
+let currentTranslateY = 0;
+let galleryView = document.querySelector('.gallery-view');
+let imageView = document.querySelector('.image-view');
+let viewerImg = document.getElementById('viewerImg');
+let viewerTitle = document.querySelector('.viewer-title');
+let viewerContent = document.querySelector('.viewer-content');
+
+// Touch gesture variables for pinch-to-zoom
+let initialDistance = 0;
+let initialScale = 1;
+let initialTranslateX = 0;
+let initialTranslateY = 0;
+let isPinching = false;
+let lastTouchTime = 0;
+let touchStartX = 0;
+let touchStartY = 0;
+let lastTouchX = 0;
+let lastTouchY = 0;
+let isPanning = false;
+
+// Rects measured once per gesture; reading them forces a layout
+let cachedImgRect = null;
+let cachedContainerRect = null;
+
+function measureViewer() {
+    cachedImgRect = viewerImg.getBoundingClientRect();
+    cachedContainerRect = viewerContent.getBoundingClientRect();
+}
+
+function clearViewerRects() {
+    cachedImgRect = null;
+    cachedContainerRect = null;
+}
+
+// Read phase: the gesture's rects, or fresh ones outside a gesture
+function viewerRects() {
+    if (cachedImgRect) {
+        return [cachedImgRect, cachedContainerRect];
+    }
+    return [viewerImg.getBoundingClientRect(), viewerContent.getBoundingClientRect()];
+}
+
+function updateImageTransform() {
+    viewerImg.style.transform = `translate(${currentTranslateX}px, ${currentTranslateY}px) scale(${currentScale})`;
+    // Zoomed in, every gesture is ours; otherwise let the browser handle touches natively
+    const touchAction = currentScale > 1 ? 'none' : 'manipulation';
+    if (viewerImg.style.touchAction !== touchAction) {
+        viewerImg.style.touchAction = touchAction;
+    }
+}
+
+// Touchmove can fire faster than the display refreshes; write the transform once per frame
+let rafScheduled = false;
+
+function scheduleImageTransform() {
+    if (!rafScheduled) {
+        rafScheduled = true;
+        requestAnimationFrame(() => {
+            rafScheduled = false;
+            updateImageTransform();
+        });
+    }
+}
+
+// Pure arithmetic on rects read beforehand, so it never forces a layout
+function constrainPan(rect, containerRect) {
+    // Calculate the scaled dimensions
+    const scaledWidth = rect.width * currentScale;
+    const scaledHeight = rect.height * currentScale;
+
+    // Calculate maximum pan limits
+    const maxPanX = Math.max(0, (scaledWidth - containerRect.width) / 2);
+    const maxPanY = Math.max(0, (scaledHeight - containerRect.height) / 2);
+
+    // Constrain panning
+    currentTranslateX = Math.max(-maxPanX, Math.min(maxPanX, currentTranslateX));
+    currentTranslateY = Math.max(-maxPanY, Math.min(maxPanY, currentTranslateY));
+}
+
+function showImage(origUrl, filename) {
+    currentOrigUrl = origUrl;
+    currentFilename = filename;
+    currentScale = 1;
+    currentTranslateX = 0;
+    currentTranslateY = 0;
+
+    viewerImg.src = origUrl;
+    viewerTitle.textContent = filename;
+    imageView.style.display = 'flex';
+
+    // Add to browser history for both mobile and desktop
+    history.pushState({view: 'image', origUrl: origUrl, filename: filename}, filename, '#image');
+
+    if (isMobile) {
+        imageView.classList.add('mobile');
+        document.querySelector('.controls-container').style.display = 'none';
+        // Reset transform for mobile
+        updateImageTransform();
+    } else {
+        imageView.classList.remove('mobile');
+        document.querySelector('.controls-container').style.display = 'flex';
+        galleryView.style.display = 'none';
+    }
+}
+
+function hideImage() {
+    imageView.style.display = 'none';
+    currentOrigUrl = null;
+    currentFilename = null;
+    currentScale = 1;
+    currentTranslateX = 0;
+    currentTranslateY = 0;
+    updateImageTransform();
+}
+
+function zoomIn() {
+    const [rect, containerRect] = viewerRects();
+    const oldScale = currentScale;
+    currentScale = Math.min(currentScale * 1.2, 3);
+
+    // Adjust translation to zoom towards center
+    const scaleRatio = currentScale / oldScale;
+    currentTranslateX *= scaleRatio;
+    currentTranslateY *= scaleRatio;
+
+    constrainPan(rect, containerRect);
+    updateImageTransform();
+}
+
+function zoomOut() {
+    const [rect, containerRect] = viewerRects();
+    const oldScale = currentScale;
+    currentScale = Math.max(currentScale / 1.2, 0.5);
+
+    // Adjust translation to zoom towards center
+    const scaleRatio = currentScale / oldScale;
+    currentTranslateX *= scaleRatio;
+    currentTranslateY *= scaleRatio;
+
+    constrainPan(rect, containerRect);
+    updateImageTransform();
+}
+
+function downloadImage() {
+    if (currentOrigUrl && currentFilename) {
+        // Call the Python backend to handle download
+        if (window.backend) {
+            window.backend.downloadImage(currentOrigUrl, currentFilename);
+        }
+    }
+}
+
+function backToGallery() {
+    imageView.style.display = 'none';
+    galleryView.style.display = 'block';
+    viewerImg.src = '';
+    currentOrigUrl = null;
+    currentFilename = null;
+    currentScale = 1;
+    currentTranslateX = 0;
+    currentTranslateY = 0;
+    updateImageTransform();
+
+    // Update browser history to go back to gallery
+    if (history.state && history.state.view === 'image') {
+        history.back();
+    }
+}
+
+function openInNewTab() {
+    if (currentOrigUrl) {
+        window.open(currentOrigUrl, '_blank');
+    }
+}
+
+// Calculate distance between two touch points
+function getDistance(touch1, touch2) {
+    const dx = touch1.clientX - touch2.clientX;
+    const dy = touch1.clientY - touch2.clientY;
+    return Math.sqrt(dx * dx + dy * dy);
+}
+
+// Calculate center point between two touches
+function getTouchCenter(touch1, touch2) {
+    return {
+        x: (touch1.clientX + touch2.clientX) / 2,
+        y: (touch1.clientY + touch2.clientY) / 2
+    };
+}
+
+// Touch event handlers for pinch-to-zoom and pan
+function handleTouchStart(e) {
+    measureViewer();
+    // Read the touch list once; each access goes through the host event object
+    const touches = e.touches;
+    const count = touches.length;
+    const t0 = touches[0];
+    const t1 = touches[1];
+    if (count === 2) {
+        // Two finger touch - start pinch gesture
+        isPinching = true;
+        isPanning = false;
+        initialDistance = getDistance(t0, t1);
+        initialScale = currentScale;
+        initialTranslateX = currentTranslateX;
+        initialTranslateY = currentTranslateY;
+
+        const center = getTouchCenter(t0, t1);
+        const rect = cachedImgRect;
+
+        // Calculate touch point relative to image center
+        touchStartX = center.x - (rect.left + rect.width / 2);
+        touchStartY = center.y - (rect.top + rect.height / 2);
+
+        e.preventDefault();
+    } else if (count === 1) {
+        // Single touch - start panning or double tap
+        isPanning = true;
+        isPinching = false;
+        lastTouchX = t0.clientX;
+        lastTouchY = t0.clientY;
+
+        const now = Date.now();
+        if (now - lastTouchTime < 300) {
+            // Double tap detected
+            if (currentScale > 1) {
+                // Reset zoom
+                currentScale = 1;
+                currentTranslateX = 0;
+                currentTranslateY = 0;
+            } else {
+                // Zoom in to double tap point
+                const rect = cachedImgRect;
+
+                // Calculate zoom center relative to image
+                const zoomCenterX = lastTouchX - (rect.left + rect.width / 2);
+                const zoomCenterY = lastTouchY - (rect.top + rect.height / 2);
+
+                // Zoom in
+                currentScale = 2;
+
+                // Adjust translation to zoom towards touch point
+                currentTranslateX = -zoomCenterX * (currentScale - 1);
+                currentTranslateY = -zoomCenterY * (currentScale - 1);
+
+                constrainPan(rect, cachedContainerRect);
+            }
+            updateImageTransform();
+            e.preventDefault();
+        }
+        lastTouchTime = now;
+    }
+}
+
+function handleTouchMove(e) {
+    // Read all layout metrics up front; everything below is arithmetic,
+    // and the only DOM write happens in the scheduled frame callback
+    const [rect, containerRect] = viewerRects();
+    const touches = e.touches;
+    const count = touches.length;
+    const t0 = touches[0];
+    const t1 = touches[1];
+    if (isPinching && count === 2) {
+        // Continue pinch gesture
+        const currentDistance = getDistance(t0, t1);
+        const scale = currentDistance / initialDistance;
+        const newScale = Math.max(0.5, Math.min(3, initialScale * scale));
+
+        // Calculate zoom center
+        const center = getTouchCenter(t0, t1);
+
+        // Calculate touch point relative to image center
+        const touchX = center.x - (rect.left + rect.width / 2);
+        const touchY = center.y - (rect.top + rect.height / 2);
+
+        // Calculate scale change
+        const scaleChange = newScale / currentScale;
+
+        // Adjust translation to zoom towards touch point
+        currentTranslateX = touchX - (touchX - currentTranslateX) * scaleChange;
+        currentTranslateY = touchY - (touchY - currentTranslateY) * scaleChange;
+
+        currentScale = newScale;
+        constrainPan(rect, containerRect);
+        scheduleImageTransform();
+
+        e.preventDefault();
+    } else if (isPanning && count === 1 && currentScale > 1) {
+        // Pan the image
+        const touchX = t0.clientX;
+        const touchY = t0.clientY;
+        const deltaX = touchX - lastTouchX;
+        const deltaY = touchY - lastTouchY;
+
+        currentTranslateX += deltaX;
+        currentTranslateY += deltaY;
+
+        constrainPan(rect, containerRect);
+        scheduleImageTransform();
+
+        lastTouchX = touchX;
+        lastTouchY = touchY;
+
+        e.preventDefault();
+    }
+}
+
+function handleTouchEnd(e) {
+    if (isPinching) {
+        // End pinch gesture
+        isPinching = false;
+        initialDistance = 0;
+        initialScale = 1;
+    }
+    if (isPanning) {
+        // End panning
+        isPanning = false;
+    }
+    clearViewerRects();
+}
+
+window.addEventListener('resize', clearViewerRects);
+
+// Handle browser back button for both mobile and desktop
+window.addEventListener('popstate', function(e) {
+    if (imageView.style.display === 'flex') {
+        hideImage();
+        // Show gallery view on desktop
+        if (!isMobile) {
+            galleryView.style.display = 'block';
+        }
+    }
+});
+
+// Set up mobile-specific handlers
+if (isMobile) {
+    document.addEventListener('DOMContentLoaded', function() {
+        const masonry = document.querySelector('.masonry');
+
+        // One delegated set of listeners for every gallery image
+        masonry.addEventListener('touchstart', function(e) {
+            const img = e.target.closest('img');
+            if (!img) {
+                return;
+            }
+            // Handle long press for download
+            const origUrl = img.dataset.origUrl;
+            const filename = img.dataset.filename;
+
+            longPressTimer = setTimeout(() => {
+                if (window.backend) {
+                    window.backend.downloadImage(origUrl, filename);
+                }
+            }, 800);
+        }, { passive: true });
+
+        // None of these cancel the touch, so scrolling never waits on them
+        masonry.addEventListener('touchend', function() {
+            if (longPressTimer) {
+                clearTimeout(longPressTimer);
+            }
+        }, { passive: true });
+
+        masonry.addEventListener('touchmove', function() {
+            if (longPressTimer) {
+                clearTimeout(longPressTimer);
+            }
+        }, { passive: true });
+
+        // Add touch event listeners to the image viewer for pinch-to-zoom and pan
+        viewerImg.addEventListener('touchstart', handleTouchStart, { passive: false });
+        viewerImg.addEventListener('touchmove', handleTouchMove, { passive: false });
+        viewerImg.addEventListener('touchend', handleTouchEnd, { passive: false });
+    });
+}
+
+// Viewer keyboard shortcuts
+const KEY_HANDLERS = {Escape: hideImage, '+': zoomIn, '-': zoomOut};
+
+document.addEventListener('keydown', function(e) {
+    if (imageView.style.display !== 'flex') {
+        return;
+    }
+    const handler = KEY_HANDLERS[e.key];
+    if (handler) {
+        handler();
+    }
+});
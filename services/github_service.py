@@ -1,4 +1,6 @@
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import logging
 from datetime import datetime
 from typing import List, Dict, Optional, Tuple
@@ -16,6 +18,15 @@ class GitHubService:
             'Authorization': f"token {Config.GITHUB_TOKEN}",
             'Accept': 'application/vnd.github.v3+json'
         }
+        # One keep-alive connection pool for every call this service makes
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        adapter = HTTPAdapter(
+            pool_connections=8,
+            pool_maxsize=32,
+            max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[502, 503, 504])
+        )
+        self.session.mount('https://', adapter)
         self._rate_limit_remaining = None
         self._rate_limit_reset = None
     
@@ -24,7 +35,7 @@ class GitHubService:
         url = f"{self.base_url}{endpoint}"
         
         try:
-            response = requests.request(method, url, headers=self.headers, **kwargs)
+            response = self.session.request(method, url, **kwargs)
             self._check_rate_limit(response)
             return response
         except requests.exceptions.RequestException as e:
@@ -81,6 +92,14 @@ class GitHubService:
         response = self._make_request('DELETE', f'/repos/{self.org}/{name}')
         return response.status_code == 204
     
+    def get_repository(self, repo_name: str) -> Dict:
+        """Get a repository's metadata"""
+        response = self._make_request('GET', f'/repos/{self.org}/{repo_name}')
+        if response.status_code == 200:
+            return response.json()
+        else:
+            raise Exception(f"Failed to get repository: {response.status_code}")
+    
     def get_repository_contents(self, repo_name: str, path: str = '') -> List[Dict]:
         """Get contents of a repository path"""
         response = self._make_request('GET', f'/repos/{self.org}/{repo_name}/contents/{path}')
@@ -137,11 +156,11 @@ class GitHubService:
         else:
             raise Exception(f"Failed to get GitHub Pages status: {response.status_code}")
     
-    def create_blob(self, repo_name: str, content: str) -> str:
+    def create_blob(self, repo_name: str, content: str, encoding: str = 'utf-8') -> str:
         """Create a blob and return its SHA"""
         data = {
             'content': content,
-            'encoding': 'utf-8'
+            'encoding': encoding
         }
         
         response = self._make_request('POST', f'/repos/{self.org}/{repo_name}/git/blobs', json=data)
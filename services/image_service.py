@@ -1,12 +1,21 @@
 import io
 import base64
 import logging
-from typing import Tuple, Optional
+from typing import Tuple, Optional, Union
 from PIL import Image, ImageOps
+try:
+    import pybase64  # optional: SIMD base64 codec
+except ImportError:
+    pybase64 = None
 from config import Config
 
 logger = logging.getLogger(__name__)
 
+_b64decode = pybase64.b64decode if pybase64 is not None else base64.b64decode
+
+# After a draft decode LANCZOS looks no better than BICUBIC and costs more
+_RESAMPLE = getattr(Image, Config.THUMBNAIL_RESAMPLE)
+
 class ImageService:
     """Service class for image processing operations"""
     
@@ -29,22 +38,28 @@ class ImageService:
             return None
     
     @staticmethod
-    def create_thumbnail(image: Image.Image, size: Tuple[int, int] = None, 
+    def create_thumbnail(image: Union[Image.Image, str], size: Tuple[int, int] = None, 
                         quality: int = None) -> Optional[Image.Image]:
-        """Create a thumbnail from an image"""
+        """Create a thumbnail from an image, or from an image file path"""
         try:
             if size is None:
                 size = Config.THUMBNAIL_SIZE
             if quality is None:
                 quality = Config.THUMBNAIL_QUALITY
             
+            if isinstance(image, str):
+                image = Image.open(image)
+                # Let libjpeg scale down during decode; only takes effect on a
+                # freshly opened image, so a caller's image is never drafted
+                image.draft('RGB', (size[0] * 2, size[1] * 2))
+            
             # Convert to RGB if necessary
             if image.mode != 'RGB':
                 image = image.convert('RGB')
             
             # Create thumbnail
             thumbnail = image.copy()
-            thumbnail.thumbnail(size, Image.LANCZOS)
+            thumbnail.thumbnail(size, _RESAMPLE)
             
             return thumbnail
         except Exception as e:
@@ -80,7 +95,7 @@ class ImageService:
             
             # Save to bytes
             buffer = io.BytesIO()
-            image.save(buffer, format='JPEG', quality=quality, optimize=True)
+            image.save(buffer, format='JPEG', quality=quality, optimize=Config.THUMBNAIL_OPTIMIZE)
             return buffer.getvalue()
         except Exception as e:
             logger.error(f"Failed to compress image: {e}")
@@ -89,13 +104,15 @@ class ImageService:
     @staticmethod
     def image_to_base64(image_bytes: bytes) -> str:
         """Convert image bytes to base64 string"""
+        if pybase64 is not None:
+            return pybase64.b64encode_as_string(image_bytes)
         return base64.b64encode(image_bytes).decode('utf-8')
     
     @staticmethod
     def base64_to_image(base64_string: str) -> Optional[bytes]:
         """Convert base64 string to image bytes"""
         try:
-            return base64.b64decode(base64_string)
+            return _b64decode(base64_string)
         except Exception as e:
             logger.error(f"Failed to decode base64 image: {e}")
             return None
@@ -121,9 +138,9 @@ class ImageService:
         """Resize image to specified size"""
         try:
             if keep_aspect_ratio:
-                return image.resize(size, Image.LANCZOS)
+                return image.resize(size, _RESAMPLE)
             else:
-                return image.resize(size, Image.LANCZOS)
+                return image.resize(size, _RESAMPLE)
         except Exception as e:
             logger.error(f"Failed to resize image: {e}")
             return None
@@ -148,11 +165,11 @@ class ImageService:
             
             # Convert original to bytes
             original_buffer = io.BytesIO()
-            original_image.save(original_buffer, format='JPEG', quality=95)
+            original_image.save(original_buffer, format='JPEG', quality=Config.ORIGINAL_QUALITY)
             original_bytes = original_buffer.getvalue()
             
-            # Create thumbnail
-            thumbnail = ImageService.create_thumbnail(original_image)
+            # Create thumbnail from a fresh decode so it can be drafted
+            thumbnail = ImageService.create_thumbnail(file_path)
             if not thumbnail:
                 return original_bytes, None
             
@@ -165,6 +182,33 @@ class ImageService:
             logger.error(f"Failed to process image {file_path}: {e}")
             return None, None
     
+    @staticmethod
+    def make_upload_thumbnail(file_path: str) -> bytes:
+        """Build the JPEG thumbnail uploaded next to an original image file"""
+        image = Image.open(file_path)
+        image = image.convert('RGB')
+        image.thumbnail(Config.THUMBNAIL_SIZE, _RESAMPLE)
+        buffer = io.BytesIO()
+        image.save(buffer, format='JPEG', quality=Config.THUMBNAIL_QUALITY)
+        return buffer.getvalue()
+
+    @staticmethod
+    def decode_square_rgba(image_bytes: bytes, size: int) -> Tuple[bytes, int, int]:
+        """Decode image bytes into centre-cropped size x size RGBA pixels - returns (pixels, width, height)"""
+        image = Image.open(io.BytesIO(image_bytes))
+        # Let libjpeg scale down during decode; a no-op for other formats
+        image.draft('RGB', (size * 2, size * 2))
+        width, height = image.size
+        side = min(width, height)
+        left = (width - side) // 2
+        top = (height - side) // 2
+        # Crop and resample in one pass instead of materialising the cropped copy;
+        # reducing_gap lets large non-JPEG sources shrink cheaply before LANCZOS
+        image = image.resize((size, size), Image.LANCZOS,
+                             box=(left, top, left + side, top + side), reducing_gap=3.0)
+        image = image.convert('RGBA')
+        return image.tobytes('raw', 'RGBA'), image.width, image.height
+
     @staticmethod
     def get_file_size_kb(bytes_data: bytes) -> float:
         """Get file size in KB"""
@@ -1,7 +1,10 @@
+import os
 import time
 import json
 import logging
 import hashlib
+import threading
+from collections import OrderedDict
 from typing import Any, Optional, Dict, List
 from datetime import datetime, timedelta
 from config import Config
@@ -219,7 +222,149 @@ class ImageCache:
         
         logger.debug(f"Invalidated image cache for repository: {repo_name}")
 
+class ThumbnailCache:
+    """On-disk cache of thumbnail bytes keyed by git blob SHA"""
+    
+    def __init__(self, cache_dir: str, max_bytes: int):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+    
+    def _path(self, sha: str) -> str:
+        """Get the cache file path for a blob SHA"""
+        return os.path.join(self.cache_dir, sha)
+    
+    def get(self, sha: str) -> Optional[bytes]:
+        """Get cached bytes for a blob SHA"""
+        if not Config.CACHE_ENABLED or not sha:
+            return None
+        
+        try:
+            with open(self._path(sha), 'rb') as f:
+                return f.read()
+        except FileNotFoundError:
+            return None
+        except OSError as e:
+            logger.warning(f"Failed to read thumbnail cache for {sha}: {e}")
+            return None
+    
+    def set(self, sha: str, data: bytes) -> None:
+        """Store bytes for a blob SHA (blob SHAs are immutable, so entries never go stale)"""
+        if not Config.CACHE_ENABLED or not sha:
+            return
+        
+        path = self._path(sha)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(tmp_path, 'wb') as f:
+                f.write(data)
+            # Atomic rename so concurrent readers never see a partial file
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(f"Failed to write thumbnail cache for {sha}: {e}")
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+    
+    def evict(self) -> None:
+        """Remove least recently used files until the cache fits in max_bytes"""
+        entries = []
+        total_size = 0
+        for root, _, files in os.walk(self.cache_dir):
+            for name in files:
+                path = os.path.join(root, name)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    # Removed by another writer's rename or eviction mid-scan
+                    continue
+                entries.append((stat.st_atime, stat.st_size, path))
+                total_size += stat.st_size
+        
+        if total_size <= self.max_bytes:
+            return
+        
+        entries.sort()
+        for _, size, path in entries:
+            try:
+                os.remove(path)
+                total_size -= size
+            except OSError:
+                continue
+            if total_size <= self.max_bytes:
+                break
+        
+        logger.debug(f"Thumbnail cache evicted to {total_size} bytes")
+
+class ETagCache:
+    """ETags and parsed bodies of GitHub GET responses, persisted between sessions"""
+    
+    def __init__(self, cache_file: str, max_entries: int):
+        self.cache_file = cache_file
+        self.max_entries = max_entries
+        # url -> [etag, data], least recently used first
+        self._entries: 'OrderedDict[str, List[Any]]' = OrderedDict()
+        self._lock = threading.Lock()
+        self._load()
+    
+    def _load(self) -> None:
+        """Load entries saved by a previous session"""
+        if not Config.CACHE_ENABLED:
+            return
+        
+        try:
+            with open(self.cache_file, 'r', encoding='utf-8') as f:
+                # Saved oldest first, so the file's order is the LRU order
+                self._entries = OrderedDict(json.load(f))
+            self._trim()
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable ETag cache {self.cache_file}: {e}")
+    
+    def get(self, url: str) -> Optional[tuple]:
+        """Get (etag, data) for a URL"""
+        with self._lock:
+            entry = self._entries.get(url)
+            if entry:
+                self._entries.move_to_end(url)
+        return tuple(entry) if entry else None
+    
+    def set(self, url: str, etag: str, data: Any) -> None:
+        """Store the ETag and parsed body of a 200 response"""
+        if not Config.CACHE_ENABLED:
+            return
+        
+        with self._lock:
+            self._entries[url] = [etag, data]
+            self._entries.move_to_end(url)
+            self._trim()
+    
+    def _trim(self) -> None:
+        """Drop least recently used entries beyond max_entries"""
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+    
+    def save(self) -> None:
+        """Write entries to disk for the next session"""
+        if not Config.CACHE_ENABLED:
+            return
+        
+        with self._lock:
+            payload = json.dumps(self._entries)
+        tmp_path = f"{self.cache_file}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(os.path.dirname(self.cache_file), exist_ok=True)
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                f.write(payload)
+            os.replace(tmp_path, self.cache_file)
+        except OSError as e:
+            logger.warning(f"Failed to save ETag cache: {e}")
+
 # Global cache instance
 cache_manager = CacheManager()
 repository_cache = RepositoryCache(cache_manager)
-image_cache = ImageCache(cache_manager) 
\ No newline at end of file
+image_cache = ImageCache(cache_manager)
+thumbnail_cache = ThumbnailCache(Config.THUMBNAIL_CACHE_DIR, Config.THUMBNAIL_CACHE_MAX_BYTES)
+etag_cache = ETagCache(Config.ETAG_CACHE_FILE, Config.ETAG_CACHE_MAX_ENTRIES) 
\ No newline at end of file